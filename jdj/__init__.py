@@ -0,0 +1,6 @@
+"""Application d'inscription à la Journée de la jeunesse (JdJ).
+
+Les pages sont réparties en modules chargés à la demande par
+``streamlit_app.py`` : un visiteur de la page d'accueil n'importe ni pandas
+ni PIL.
+"""
@@ -0,0 +1,175 @@
+"""Import en masse d'inscriptions depuis un fichier CSV ou XLSX.
+
+Le fichier est lu par blocs et validé colonne par colonne avec pandas
+(format des emails, dates, champs obligatoires, doublons dans le fichier et
+dans l'événement), sans appel ligne à ligne. Les lignes acceptées sont
+ensuite enregistrées en une seule écriture par ``import_registrations``.
+
+Ce module importe pandas : il n'est chargé que depuis le tableau de bord.
+"""
+
+import csv
+import io
+import unicodedata
+from datetime import date, datetime
+
+import pandas as pd
+
+from jdj.utils import EMAIL_PATTERN
+
+CHUNK_SIZE = 10_000
+
+# Noms de colonnes acceptés (normalisés : minuscules, sans accents ni espaces)
+COLUMN_ALIASES = {
+    'email': 'email',
+    'adresseemail': 'email',
+    'mail': 'email',
+    'nom': 'nom',
+    'prenom': 'prenom',
+    'datenaissance': 'date_naissance',
+    'datedenaissance': 'date_naissance',
+    'naissance': 'date_naissance',
+}
+REQUIRED_COLUMNS = ['email', 'nom', 'prenom', 'date_naissance']
+
+# Formats de date essayés, dans l'ordre
+DATE_FORMATS = ['ISO8601', '%d.%m.%Y', '%d/%m/%Y']
+
+
+def _normalize_header(header):
+    text = unicodedata.normalize('NFKD', str(header)).encode('ascii', 'ignore').decode()
+    return ''.join(ch for ch in text.lower() if ch.isalnum())
+
+def _decode_csv(uploaded_file):
+    """Texte d'un CSV : UTF-8 (avec ou sans BOM), sinon Windows-1252 (CSV « ANSI » d'Excel)"""
+    data = uploaded_file.getvalue()
+    try:
+        return data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        pass
+    try:
+        return data.decode('cp1252')
+    except UnicodeDecodeError:
+        raise ValueError("Encodage du fichier non reconnu (UTF-8 ou Windows-1252 attendu)") from None
+
+def read_chunks(uploaded_file, chunksize=CHUNK_SIZE):
+    """Lit un fichier CSV ou XLSX par blocs de lignes (toutes les valeurs en texte)
+
+    Le CSV est décodé (UTF-8 ou Windows-1252) puis lu par blocs. pandas ne
+    sait pas lire un XLSX par morceaux : la feuille est chargée puis découpée
+    en blocs (nécessite openpyxl).
+
+    Les erreurs des lecteurs (séparateur introuvable, archive XLSX
+    corrompue...) sont transformées en ``ValueError``.
+    """
+    name = uploaded_file.name.lower()
+    if name.endswith('.csv'):
+        try:
+            # sep=None : détection automatique du séparateur (',' ou ';')
+            yield from pd.read_csv(
+                io.StringIO(_decode_csv(uploaded_file)), dtype=str, keep_default_na=False,
+                sep=None, engine='python', chunksize=chunksize
+            )
+        except csv.Error as e:
+            raise ValueError(f"CSV illisible ({e})") from e
+    elif name.endswith(('.xlsx', '.xlsm')):
+        try:
+            sheet = pd.read_excel(uploaded_file, dtype=str, keep_default_na=False)
+        except (ImportError, ValueError):
+            raise
+        except Exception as e:
+            # zipfile, openpyxl et pandas lèvent chacun leurs propres erreurs
+            raise ValueError(f"Fichier XLSX corrompu ({e})") from e
+        for start in range(0, len(sheet), chunksize):
+            yield sheet.iloc[start:start + chunksize]
+    else:
+        raise ValueError("Format non supporté (CSV ou XLSX attendu)")
+
+def normalize_columns(df):
+    """Renomme les colonnes reconnues et vérifie les colonnes obligatoires"""
+    df = df.rename(columns=lambda c: COLUMN_ALIASES.get(_normalize_header(c), c))
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError("Colonnes manquantes : " + ", ".join(missing))
+    return df[REQUIRED_COLUMNS]
+
+def parse_dates(values):
+    """Convertit une colonne de dates texte, NaT si aucun format ne correspond
+
+    Résolution à la seconde : une date comme 2999-12-31, hors de la plage des
+    nanosecondes, reste une date (rejetée ensuite comme hors limites).
+    """
+    parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[s]')
+    for fmt in DATE_FORMATS:
+        todo = parsed.isna() & values.ne('')
+        if not todo.any():
+            break
+        parsed[todo] = pd.to_datetime(values[todo], format=fmt, errors='coerce')
+    return parsed
+
+def validate_chunk(df, known_emails, today=None):
+    """Valide un bloc de lignes sans boucle Python
+
+    ``known_emails`` contient les emails (en minuscules) déjà présents dans
+    l'événement ou vus dans les blocs précédents ; il est complété avec les
+    lignes acceptées. Retourne ``(acceptées, rejetées)``, les rejetées ayant
+    une colonne ``motif``.
+    """
+    today = pd.Timestamp(today or date.today())
+    df = normalize_columns(df).apply(lambda col: col.str.strip())
+    emails = df['email'].str.lower()
+    birth = parse_dates(df['date_naissance'])
+
+    # Premier motif de rejet trouvé pour chaque ligne (les conditions sont
+    # appliquées de la dernière à la première pour que la première l'emporte)
+    checks = [
+        (~df['email'].str.match(EMAIL_PATTERN), "Adresse email invalide"),
+        (df['nom'].eq(''), "Le nom est obligatoire"),
+        (df['prenom'].eq(''), "Le prénom est obligatoire"),
+        (birth.isna(), "Date de naissance invalide"),
+        ((birth < pd.Timestamp(1900, 1, 1)) | (birth > today), "Date de naissance hors limites"),
+        (emails.isin(known_emails), "Email déjà inscrit"),
+    ]
+    reason = pd.Series('', index=df.index)
+    for mask, message in reversed(checks):
+        reason = reason.mask(mask.fillna(True).astype(bool), message)
+
+    # Doublons dans le fichier : seule la première ligne valide est gardée
+    duplicate = reason.eq('') & emails.where(reason.eq('')).duplicated(keep='first')
+    reason = reason.mask(duplicate, "Email en double dans le fichier")
+
+    ok = reason.eq('')
+    accepted = df[ok].assign(date_naissance=birth[ok].dt.strftime('%Y-%m-%d'))
+    rejected = df[~ok].assign(motif=reason[~ok])
+    known_emails.update(emails[ok])
+    return accepted, rejected
+
+def prepare_import(uploaded_file, existing_emails, chunksize=CHUNK_SIZE):
+    """Lit et valide tout le fichier, bloc par bloc
+
+    Retourne ``(acceptées, rejetées)``. Les numéros de ligne (``ligne``)
+    correspondent au fichier d'origine, en-tête compris.
+    """
+    known = {email.lower() for email in existing_emails}
+    accepted, rejected = [], []
+    offset = 2  # la première ligne de données suit l'en-tête
+    for chunk in read_chunks(uploaded_file, chunksize):
+        chunk = chunk.reset_index(drop=True)
+        chunk.index = chunk.index + offset
+        offset += len(chunk)
+        ok, ko = validate_chunk(chunk, known)
+        accepted.append(ok)
+        rejected.append(ko)
+
+    if not accepted:
+        empty = pd.DataFrame(columns=REQUIRED_COLUMNS)
+        return empty, empty.assign(motif=pd.Series(dtype=str))
+    return (
+        pd.concat(accepted).rename_axis('ligne'),
+        pd.concat(rejected).rename_axis('ligne'),
+    )
+
+def to_registrations(accepted, confirmed=False):
+    """Convertit les lignes acceptées en inscriptions prêtes à enregistrer"""
+    now = str(datetime.now())
+    return accepted.assign(date_inscription=now, confirmed=confirmed).to_dict('records')
@@ -0,0 +1,25 @@
+"""Constantes de configuration de l'application"""
+
+# Configuration des fichiers de données
+REGISTRATIONS_FILE = "registrations.json"
+CONFIRMED_FILE = "confirmed.json"
+MODERATORS_FILE = "moderators.json"
+IMAGE_CONFIG_FILE = "image_config.json"
+CONTENT_CONFIG_FILE = "content_config.json"
+IMAGES_FOLDER = "uploaded_images"
+
+# Mot de passe par défaut pour les modérateurs (à changer en production)
+DEFAULT_MODERATOR_PASSWORD = "admin123"
+
+# Stockage des événements : un index et un dossier par événement
+EVENTS_FILE = "events.json"
+EVENTS_FOLDER = "events"
+
+# Versions publiées du contenu personnalisé (instantanés immuables)
+CONTENT_VERSIONS_FOLDER = "content_versions"
+
+# Intervalle de vérification des nouvelles données pour les modérateurs (secondes)
+REFRESH_SECONDS = 5
+
+# Résumé des événements traités par la politique de rétention
+HISTORY_SUMMARY_FILE = "history_summary.json"
@@ -0,0 +1,110 @@
+"""Contenu personnalisé de la page d'accueil, publié par versions.
+
+Chaque publication écrit un nouvel instantané immuable
+``content_versions/vNNNN.json`` puis fait pointer
+``content_versions/current.json`` dessus. Revenir à une version précédente
+ne réécrit que ce pointeur. Les visiteurs lisent toujours une version
+publiée complète, jamais un état intermédiaire.
+
+Les modifications des modérateurs sont préparées dans un brouillon en
+session (voir ``jdj.views.moderator``) puis publiées en une seule fois.
+"""
+
+import os
+import re
+from datetime import datetime
+
+from jdj.config import CONTENT_CONFIG_FILE, CONTENT_VERSIONS_FOLDER
+from jdj.storage import atomic_write_json, file_lock, load_cached, load_data
+
+SNAPSHOT_PATTERN = re.compile(r'^v(\d+)\.json$')
+
+
+def _snapshot_path(version):
+    return os.path.join(CONTENT_VERSIONS_FOLDER, f"v{version:04d}.json")
+
+def _pointer_path():
+    return os.path.join(CONTENT_VERSIONS_FOLDER, "current.json")
+
+def _lock_path():
+    return os.path.join(CONTENT_VERSIONS_FOLDER, ".lock")
+
+def list_content_versions():
+    """Numéros des versions publiées, de la plus récente à la plus ancienne"""
+    if not os.path.isdir(CONTENT_VERSIONS_FOLDER):
+        return []
+    versions = []
+    for filename in os.listdir(CONTENT_VERSIONS_FOLDER):
+        match = SNAPSHOT_PATTERN.match(filename)
+        if match:
+            versions.append(int(match.group(1)))
+    return sorted(versions, reverse=True)
+
+def _write_snapshot(elements):
+    """Écrit un nouvel instantané et retourne son numéro (verrou déjà pris)"""
+    version = max(list_content_versions(), default=0) + 1
+    atomic_write_json({
+        'version': version,
+        'published_at': str(datetime.now()),
+        'elements': elements,
+    }, _snapshot_path(version))
+    return version
+
+def _migrate_legacy_content():
+    """Reprend l'ancien ``content_config.json`` comme première version"""
+    with file_lock(_lock_path()):
+        if os.path.exists(_pointer_path()):
+            return
+        elements = load_data(CONTENT_CONFIG_FILE).get('elements', [])
+        version = _write_snapshot(elements)
+        atomic_write_json({'version': version}, _pointer_path())
+
+def current_content_version():
+    """Numéro de la version actuellement publiée"""
+    pointer = load_cached(_pointer_path())
+    if not pointer:
+        _migrate_legacy_content()
+        pointer = load_cached(_pointer_path())
+    return pointer['version']
+
+def load_content_version(version):
+    """Charge un instantané (immuable, donc mis en cache sans limite de durée)"""
+    return load_cached(_snapshot_path(version))
+
+def load_content_config():
+    """Charge le contenu actuellement publié"""
+    return load_content_version(current_content_version()) or {"elements": []}
+
+def publish_content(elements, base_version=None):
+    """Publie une nouvelle version du contenu et retourne son numéro
+
+    Si ``base_version`` est donné et qu'une autre publication a eu lieu
+    depuis, rien n'est écrit et ``ValueError`` est levée.
+    """
+    current_content_version()  # migration éventuelle
+    with file_lock(_lock_path()):
+        current = load_data(_pointer_path()).get('version')
+        if base_version is not None and current != base_version:
+            raise ValueError(
+                f"La version {current} a été publiée entre-temps "
+                f"(brouillon basé sur la version {base_version})"
+            )
+        version = _write_snapshot(elements)
+        atomic_write_json({'version': version}, _pointer_path())
+    return version
+
+def rollback_content(version):
+    """Republie une version précédente (seul le pointeur est réécrit)"""
+    if not os.path.exists(_snapshot_path(version)):
+        raise ValueError(f"Version {version} introuvable")
+    with file_lock(_lock_path()):
+        atomic_write_json({'version': version}, _pointer_path())
+
+def referenced_images():
+    """Chemins des images locales utilisées par au moins une version conservée"""
+    paths = set()
+    for version in list_content_versions():
+        for element in (load_content_version(version) or {}).get("elements", []):
+            if element.get("type") == "image" and element.get("image_path"):
+                paths.add(element["image_path"])
+    return paths
@@ -0,0 +1,112 @@
+"""Affichage du contenu personnalisé et de l'image d'accueil"""
+
+import os
+
+import streamlit as st
+
+from jdj.content import load_content_config
+from jdj.events import event_label
+from jdj.storage import load_image_config
+
+
+def display_custom_content(elements=None):
+    """Affiche le contenu personnalisé configuré par les administrateurs
+
+    Sans argument, affiche la version publiée ; les modérateurs passent les
+    éléments de leur brouillon pour le prévisualiser.
+    """
+    if elements is None:
+        elements = load_content_config().get("elements", [])
+    
+    if not elements:
+        return
+    
+    for element in elements:
+        element_type = element.get("type")
+        
+        if element_type == "text":
+            if element.get("style") == "header":
+                st.header(element.get("content", ""))
+            elif element.get("style") == "subheader":
+                st.subheader(element.get("content", ""))
+            elif element.get("style") == "markdown":
+                st.markdown(element.get("content", ""))
+            else:  # normal text
+                st.write(element.get("content", ""))
+                
+        elif element_type == "image":
+            if element.get("image_type") == "url" and element.get("image_url"):
+                try:
+                    st.image(
+                        element["image_url"], 
+                        caption=element.get("caption", ""),
+                        width=element.get("width")
+                    )
+                except:
+                    st.error("Erreur lors du chargement de l'image")
+            elif element.get("image_type") == "local" and element.get("image_path"):
+                try:
+                    if os.path.exists(element["image_path"]):
+                        st.image(
+                            element["image_path"], 
+                            caption=element.get("caption", ""),
+                            width=element.get("width")
+                        )
+                    else:
+                        st.error("Image locale introuvable")
+                except:
+                    st.error("Erreur lors du chargement de l'image locale")
+                    
+def display_image_from_config():
+    """Affiche l'image selon la configuration"""
+    image_config = load_image_config()
+    
+    if image_config.get("image_type") == "url" and image_config.get("image_url"):
+        try:
+            st.image(image_config["image_url"], caption=image_config.get("image_caption", ""), use_container_width=True)
+            return True
+        except Exception as e:
+            st.error("Erreur lors du chargement de l'image depuis l'URL")
+            return False
+    elif image_config.get("image_type") == "local" and image_config.get("image_path"):
+        try:
+            if os.path.exists(image_config["image_path"]):
+                st.image(image_config["image_path"], caption=image_config.get("image_caption", ""), use_container_width=True)
+                return True
+            else:
+                st.error("Le fichier image local n'existe plus")
+                return False
+        except Exception as e:
+            st.error("Erreur lors du chargement de l'image locale")
+            return False
+    else:
+        st.info("Aucune image configurée")
+        return False
+
+def select_event(events, label="Événement", key="event_select"):
+    """Sélecteur d'événement partagé par les pages
+
+    Retient le choix dans ``st.session_state.event_id`` et retourne
+    l'événement sélectionné (ou None s'il n'y en a aucun).
+    """
+    if not events:
+        return None
+    
+    ids = [e['id'] for e in events]
+    current = st.session_state.get('event_id')
+    index = ids.index(current) if current in ids else 0
+    
+    if len(events) == 1:
+        selected = events[0]
+    else:
+        by_id = {e['id']: e for e in events}
+        selected_id = st.selectbox(
+            label,
+            ids,
+            index=index,
+            format_func=lambda event_id: event_label(by_id[event_id]),
+            key=key
+        )
+        selected = by_id[selected_id]
+    st.session_state.event_id = selected['id']
+    return selected
@@ -0,0 +1,351 @@
+"""Événements et stockage des inscriptions partitionné par événement.
+
+L'index des événements est conservé dans ``events.json``. Les inscriptions
+de chaque événement vivent dans leur propre dossier
+``events/<id>/registrations.json``, protégé par son propre verrou : une
+écriture sur un événement ne réécrit ni ne bloque jamais les autres.
+
+À côté, ``events/<id>/counter.json`` tient le nombre de places occupées et
+de personnes en liste d'attente. Il est mis à jour dans la même section
+critique que les inscriptions et se lit sans parcourir celles-ci.
+"""
+
+import os
+import re
+from contextlib import contextmanager
+from datetime import date
+
+from jdj.config import EVENTS_FILE, EVENTS_FOLDER, REGISTRATIONS_FILE
+from jdj.storage import atomic_write_json, file_lock, file_version, load_data, load_cached
+
+EVENT_ID_PATTERN = re.compile(r'^[0-9A-Za-z_-]+$')
+
+
+def new_event(event_id, nom, date_event, capacite=None, contenu=""):
+    """Construit un événement"""
+    return {
+        'id': event_id,
+        'nom': nom,
+        'date': str(date_event),
+        'capacite': capacite,
+        'contenu': contenu,
+    }
+
+def event_folder(event_id):
+    """Retourne le dossier de stockage d'un événement"""
+    if not EVENT_ID_PATTERN.match(event_id):
+        raise ValueError(f"Identifiant d'événement invalide : {event_id!r}")
+    return os.path.join(EVENTS_FOLDER, event_id)
+
+def _registrations_path(event_id):
+    return os.path.join(event_folder(event_id), "registrations.json")
+
+def _counter_path(event_id):
+    return os.path.join(event_folder(event_id), "counter.json")
+
+def _event_lock_path(event_id):
+    return os.path.join(event_folder(event_id), ".lock")
+
+def _index_lock_path():
+    return os.path.join(EVENTS_FOLDER, ".index.lock")
+
+def _unique_ids(registrations):
+    """Renumérote les inscriptions dont l'identifiant est déjà pris
+
+    L'ancien code attribuait ``len(liste) + 1`` : une suppression suivie
+    d'une inscription pouvait donner deux fois le même identifiant. Les
+    doublons reçoivent un identifiant après le plus grand existant.
+    """
+    next_id = max((reg['id'] for reg in registrations), default=0) + 1
+    seen = set()
+    for reg in registrations:
+        if reg['id'] in seen:
+            reg['id'] = next_id
+            next_id += 1
+        seen.add(reg['id'])
+    return registrations
+
+def migrate_legacy_registrations():
+    """Migre l'ancien fichier (une clé par année) vers un événement par année
+
+    Ne fait rien si l'index des événements existe déjà. L'ancien fichier est
+    conservé tel quel.
+    """
+    with file_lock(_index_lock_path()):
+        if os.path.exists(EVENTS_FILE):
+            return
+        legacy = load_data(REGISTRATIONS_FILE)
+        events = []
+        for year in sorted(legacy):
+            event = new_event(year, f"Journée de la jeunesse {year}", f"{year}-12-31")
+            os.makedirs(event_folder(year), exist_ok=True)
+            registrations = _unique_ids(legacy[year])
+            atomic_write_json({'version': 0, 'registrations': registrations}, _registrations_path(year))
+            events.append(event)
+        atomic_write_json({'events': events}, EVENTS_FILE)
+
+def load_events():
+    """Charge la liste des événements, du plus récent au plus ancien"""
+    if not os.path.exists(EVENTS_FILE):
+        migrate_legacy_registrations()
+    events = load_cached(EVENTS_FILE).get('events', [])
+    return sorted(events, key=lambda e: e['date'], reverse=True)
+
+def get_event(event_id):
+    """Retourne l'événement correspondant à l'identifiant, ou None"""
+    for event in load_events():
+        if event['id'] == event_id:
+            return event
+    return None
+
+def upcoming_events(today=None):
+    """Événements à venir (ouverts aux inscriptions), du plus proche au plus lointain"""
+    today = str(today or date.today())
+    return sorted((e for e in load_events() if e['date'] >= today), key=lambda e: e['date'])
+
+def make_event_id(date_event):
+    """Génère un identifiant unique à partir de la date de l'événement"""
+    existing = {e['id'] for e in load_events()}
+    base = str(date_event)
+    event_id, suffix = base, 2
+    while event_id in existing:
+        event_id = f"{base}-{suffix}"
+        suffix += 1
+    return event_id
+
+def save_event(event):
+    """Crée ou met à jour un événement dans l'index"""
+    load_events()  # migration éventuelle avant la première écriture
+    with file_lock(_index_lock_path()):
+        events = [e for e in load_data(EVENTS_FILE).get('events', []) if e['id'] != event['id']]
+        events.append(event)
+        os.makedirs(event_folder(event['id']), exist_ok=True)
+        atomic_write_json({'events': events}, EVENTS_FILE)
+
+def event_label(event):
+    """Libellé d'un événement pour les listes de sélection"""
+    return f"{event['nom']} ({event['date']})"
+
+def _read_registrations(event_id):
+    """Lit les inscriptions d'un événement et leur numéro de version"""
+    data = load_data(_registrations_path(event_id))
+    if isinstance(data, list):  # format sans numéro de version
+        return data, 0
+    return data.get('registrations', []), data.get('version', 0)
+
+def load_registrations(event_id):
+    """Charge les inscriptions d'un événement (liste d'attente comprise)"""
+    data = load_cached(_registrations_path(event_id))
+    if isinstance(data, list):  # format sans numéro de version
+        return data
+    return data.get('registrations', [])
+
+def _count(registrations, version):
+    """Recalcule le compteur d'un événement à partir de ses inscriptions"""
+    waitlisted = len([reg for reg in registrations if reg.get('waitlisted')])
+    return {
+        'version': version,
+        'occupied': len(registrations) - waitlisted,
+        'waitlisted': waitlisted,
+        'confirmed': len([reg for reg in registrations if reg['confirmed']]),
+        'next_id': max((reg['id'] for reg in registrations), default=0) + 1,
+    }
+
+def load_counter(event_id):
+    """Lit le compteur d'un événement sans parcourir ses inscriptions
+
+    Le compteur (places occupées, inscriptions confirmées, personnes en liste
+    d'attente, prochain identifiant) est tenu à jour à chaque écriture, sous
+    le verrou de l'événement. S'il n'existe pas encore, ou s'il a été écrit
+    par une version antérieure sans le nombre de confirmées, il est
+    reconstruit une fois.
+    """
+    counter = load_data(_counter_path(event_id))
+    if 'confirmed' not in counter:
+        with _transaction(event_id) as state:
+            counter = dict(state['counter'])
+    return counter
+
+def data_version(event_id):
+    """Version des inscriptions d'un événement, lue sans ouvrir le fichier
+
+    Change à chaque écriture, quel que soit le processus qui l'a faite : la
+    comparer à la version précédente suffit pour savoir s'il faut relire.
+    """
+    return file_version(_registrations_path(event_id))
+
+def spots_left(event):
+    """Places restantes d'un événement (None si la capacité est illimitée)"""
+    if not event.get('capacite'):
+        return None
+    return max(event['capacite'] - load_counter(event['id'])['occupied'], 0)
+
+@contextmanager
+def _transaction(event_id):
+    """Verrouille un événement pour lire et modifier ses inscriptions
+
+    Fournit un état ``{'registrations', 'counter', 'changed', 'versions'}``.
+    Si ``changed`` est vrai à la sortie du bloc, les inscriptions puis le
+    compteur sont réécrits avec un nouveau numéro de version. ``versions``
+    donne la ``data_version`` du fichier avant et après cette écriture.
+    Seul le verrou de cet événement est pris.
+    """
+    with file_lock(_event_lock_path(event_id)):
+        before = data_version(event_id)
+        registrations, version = _read_registrations(event_id)
+        counter = load_data(_counter_path(event_id))
+        rebuilt = counter.get('version') != version or 'confirmed' not in counter
+        if rebuilt:
+            # Compteur absent ou en retard (écriture interrompue) : on le recalcule
+            counter = _count(registrations, version)
+        
+        state = {
+            'registrations': registrations,
+            'counter': counter,
+            'changed': False,
+            'versions': {'before': before, 'after': before},
+        }
+        yield state
+        
+        if state['changed']:
+            version += 1
+            counter['version'] = version
+            atomic_write_json({'version': version, 'registrations': registrations}, _registrations_path(event_id))
+            state['versions']['after'] = data_version(event_id)
+        if state['changed'] or rebuilt:
+            atomic_write_json(counter, _counter_path(event_id))
+
+def _promote(event, state):
+    """Fait passer les premiers de la liste d'attente sur les places libres"""
+    capacity = event.get('capacite')
+    counter = state['counter']
+    promoted = []
+    for reg in state['registrations']:
+        if capacity and counter['occupied'] >= capacity:
+            break
+        if reg.get('waitlisted'):
+            reg['waitlisted'] = False
+            counter['occupied'] += 1
+            counter['waitlisted'] -= 1
+            promoted.append(reg)
+    if promoted:
+        state['changed'] = True
+    return promoted
+
+def register(event, registration):
+    """Enregistre une inscription, sur liste d'attente si l'événement est complet
+
+    Retourne ``'inscrit'``, ``'attente'`` ou ``'doublon'`` (email déjà
+    enregistré pour cet événement, sans tenir compte de la casse, comme pour
+    l'import).
+    """
+    email = registration['email'].lower()
+    with _transaction(event['id']) as state:
+        if any(reg.get('email', '').lower() == email for reg in state['registrations']):
+            return 'doublon'
+        
+        counter = state['counter']
+        capacity = event.get('capacite')
+        full = bool(capacity) and counter['occupied'] >= capacity
+        
+        registration = dict(registration, id=counter['next_id'], waitlisted=full)
+        state['registrations'].append(registration)
+        counter['next_id'] += 1
+        counter['waitlisted' if full else 'occupied'] += 1
+        state['changed'] = True
+    return 'attente' if full else 'inscrit'
+
+def import_registrations(event, rows):
+    """Enregistre un lot d'inscriptions en une seule écriture
+
+    Les lignes dont l'email (sans tenir compte de la casse) est déjà présent
+    dans l'événement sont ignorées : un import concurrent ou une inscription
+    arrivée entre l'aperçu et la validation ne crée pas de doublon. Les
+    places sont attribuées dans l'ordre des lignes, le reste passe sur liste
+    d'attente. Retourne ``{'inscrit': n, 'attente': n, 'doublon': n}``.
+    """
+    result = {'inscrit': 0, 'attente': 0, 'doublon': 0}
+    with _transaction(event['id']) as state:
+        counter = state['counter']
+        capacity = event.get('capacite')
+        emails = {reg.get('email', '').lower() for reg in state['registrations']}
+        
+        for row in rows:
+            if row['email'].lower() in emails:
+                result['doublon'] += 1
+                continue
+            emails.add(row['email'].lower())
+            
+            full = bool(capacity) and counter['occupied'] >= capacity
+            confirmed = bool(row.get('confirmed')) and not full
+            state['registrations'].append(dict(row, id=counter['next_id'], waitlisted=full, confirmed=confirmed))
+            counter['next_id'] += 1
+            counter['confirmed'] += confirmed
+            counter['waitlisted' if full else 'occupied'] += 1
+            result['attente' if full else 'inscrit'] += 1
+        
+        state['changed'] = result['inscrit'] + result['attente'] > 0
+    return result
+
+def confirm_registration(event_id, registration_id):
+    """Confirme une inscription (hors liste d'attente)
+
+    Retourne ``{'before', 'after'}``, la version des données avant et après
+    l'écriture, pour qu'un cache puisse appliquer la modification sans tout
+    relire.
+    """
+    with _transaction(event_id) as state:
+        for reg in state['registrations']:
+            if reg['id'] == registration_id and not reg.get('waitlisted') and not reg['confirmed']:
+                reg['confirmed'] = True
+                state['counter']['confirmed'] += 1
+                state['changed'] = True
+                break
+    return dict(state['versions'])
+
+def delete_registration(event, registration_id):
+    """Supprime une inscription et promeut la liste d'attente si une place se libère
+
+    Retourne ``{'before', 'after', 'promoted'}`` : les versions des données
+    (voir ``confirm_registration``) et la liste des inscriptions promues.
+    """
+    promoted = []
+    with _transaction(event['id']) as state:
+        registrations = state['registrations']
+        for i, reg in enumerate(registrations):
+            if reg['id'] == registration_id:
+                registrations.pop(i)
+                state['counter']['waitlisted' if reg.get('waitlisted') else 'occupied'] -= 1
+                if reg['confirmed']:
+                    state['counter']['confirmed'] -= 1
+                state['changed'] = True
+                promoted = _promote(event, state)
+                break
+    return dict(state['versions'], promoted=promoted)
+
+def replace_registrations(event_id, transform):
+    """Réécrit toutes les inscriptions d'un événement (traitements par lot)
+
+    ``transform`` reçoit la liste des inscriptions et retourne la nouvelle
+    liste ; le compteur est recalculé et les identifiants déjà attribués ne
+    sont jamais réutilisés. Retourne la taille du fichier (en octets) avant
+    et après l'écriture.
+    """
+    path = _registrations_path(event_id)
+    with _transaction(event_id) as state:
+        size_before = os.path.getsize(path) if os.path.exists(path) else 0
+        registrations = transform(state['registrations'])
+        
+        counter = state['counter']
+        next_id = counter['next_id']
+        counter.update(_count(registrations, counter['version']))
+        counter['next_id'] = max(counter['next_id'], next_id)
+        
+        state['registrations'][:] = registrations
+        state['changed'] = True
+    return size_before, os.path.getsize(path)
+
+def promote_waitlist(event):
+    """Remplit les places libres depuis la liste d'attente (après une hausse de capacité)"""
+    with _transaction(event['id']) as state:
+        return _promote(event, state)
@@ -0,0 +1,132 @@
+"""Traitement des images uploadées par les modérateurs.
+
+Une image uploadée est décodée une seule fois par fichier, directement à
+taille réduite quand le format le permet (mode brouillon JPEG, qui décode à
+1/2, 1/4 ou 1/8 de la résolution). Le résultat
+(miniature JPEG ≤ 800×600) sert à la fois pour l'aperçu et pour la
+sauvegarde. Les images dont la taille annoncée dépasse ``MAX_IMAGE_PIXELS``
+sont refusées avant tout décodage (protection contre les « bombes de
+décompression »).
+
+Ce module importe PIL : il n'est chargé que depuis le tableau de bord.
+"""
+
+import io
+import os
+import warnings
+from datetime import datetime
+
+import streamlit as st
+from PIL import Image
+
+from jdj.config import IMAGES_FOLDER
+
+MAX_SIZE = (800, 600)
+
+# Environ 60 mégapixels : au-delà, l'image est refusée sans être décodée
+MAX_IMAGE_PIXELS = 60_000_000
+Image.MAX_IMAGE_PIXELS = MAX_IMAGE_PIXELS
+
+
+def _buffer_size(image):
+    """Taille en octets du tampon de pixels d'une image décodée"""
+    return image.size[0] * image.size[1] * len(image.getbands())
+
+def ingest_image(data, name):
+    """Décode une image à taille réduite et l'encode en JPEG
+
+    Retourne un dictionnaire avec le JPEG (``data``), la taille d'origine,
+    la taille réellement décodée et la mémoire utilisée pour les pixels
+    (``decoded_bytes``, à comparer à ``full_bytes`` en pleine résolution).
+    Lève ``ValueError`` pour une image illisible ou trop grande.
+    """
+    try:
+        with warnings.catch_warnings():
+            # Le dépassement de MAX_IMAGE_PIXELS est traité ci-dessous
+            warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+            image = Image.open(io.BytesIO(data))
+        with image:
+            # Seul l'en-tête est lu à ce stade
+            width, height = image.size
+            if width * height > MAX_IMAGE_PIXELS:
+                raise ValueError(
+                    f"Image trop grande ({width}×{height}, "
+                    f"maximum {MAX_IMAGE_PIXELS // 1_000_000} mégapixels)"
+                )
+            full_bytes = width * height * len(image.getbands())
+
+            # JPEG : décodage direct à une fraction de la résolution
+            image.draft("RGB", MAX_SIZE)
+            image.load()
+            decoded_size = image.size
+            decoded_bytes = _buffer_size(image)
+
+            # Redimensionner l'image si elle est trop grande
+            if image.size[0] > MAX_SIZE[0] or image.size[1] > MAX_SIZE[1]:
+                image.thumbnail(MAX_SIZE, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+            # Convertir en RGB si nécessaire (JPEG n'accepte ni transparence ni palette)
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+
+            output = io.BytesIO()
+            image.save(output, "JPEG", quality=85)
+    except Image.DecompressionBombError as e:
+        raise ValueError(f"Image refusée : {e}") from e
+    except (OSError, SyntaxError) as e:
+        raise ValueError(f"Image illisible : {e}") from e
+
+    return {
+        'name': name,
+        'data': output.getvalue(),
+        'size': (width, height),
+        'decoded_size': decoded_size,
+        'decoded_bytes': decoded_bytes,
+        'full_bytes': full_bytes,
+    }
+
+def ingest_uploaded_image(uploaded_file):
+    """Traite une image uploadée une seule fois par fichier
+
+    Le résultat est gardé en session : l'aperçu puis la sauvegarde du même
+    fichier réutilisent la même miniature sans redécoder l'image.
+    """
+    cache = st.session_state.setdefault('ingested_images', {})
+    if uploaded_file.file_id not in cache:
+        ingested = ingest_image(uploaded_file.getvalue(), uploaded_file.name)
+        # Un seul fichier par uploader : les résultats précédents sont oubliés
+        cache.clear()
+        cache[uploaded_file.file_id] = ingested
+    return cache[uploaded_file.file_id]
+
+def memory_report(ingested):
+    """Texte décrivant la mémoire utilisée pour décoder une image"""
+    width, height = ingested['size']
+    decoded_width, decoded_height = ingested['decoded_size']
+    return (
+        f"Original {width}×{height}, décodé en {decoded_width}×{decoded_height} : "
+        f"{ingested['decoded_bytes'] / 1024 / 1024:.1f} Mo de pixels "
+        f"(au lieu de {ingested['full_bytes'] / 1024 / 1024:.1f} Mo en pleine résolution)"
+    )
+
+def save_uploaded_image(uploaded_file):
+    """Sauvegarde une image uploadée et retourne le chemin"""
+    if uploaded_file is not None:
+        try:
+            ingested = ingest_uploaded_image(uploaded_file)
+        except ValueError as e:
+            st.error(f"Erreur lors de la sauvegarde de l'image : {e}")
+            return None
+
+        # Créer le dossier pour les images uploadées s'il n'existe pas
+        os.makedirs(IMAGES_FOLDER, exist_ok=True)
+
+        # Générer un nom de fichier unique
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{timestamp}_{uploaded_file.name}"
+        filepath = os.path.join(IMAGES_FOLDER, filename)
+
+        with open(filepath, 'wb') as f:
+            f.write(ingested['data'])
+        return filepath
+    return None
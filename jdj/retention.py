@@ -0,0 +1,199 @@
+"""Politique de rétention des inscriptions des événements passés.
+
+Les événements dont la date remonte à plus de ``years`` ans sont traités un
+par un, du plus ancien au plus récent : seules les inscriptions d'un
+événement sont en mémoire à un instant donné. Trois modes :
+
+- ``anonymize`` : les inscriptions restent, sans nom, prénom, email ni
+  date de naissance (champs retirés) ; seule l'année de naissance
+  (``annee_naissance``) est gardée ;
+- ``aggregate`` : les inscriptions sont supprimées, le résumé garde les
+  effectifs et leur répartition par année de naissance ;
+- ``purge`` : les inscriptions sont supprimées, le résumé ne garde que les
+  effectifs.
+
+Le résumé (``history_summary.json``) permet à l'onglet Historique
+d'afficher les effectifs des événements archivés. La copie de l'ancien
+``registrations.json`` (déjà migré) perd aussi les années traitées.
+
+Usage en ligne de commande, depuis le dossier des données :
+    python -m jdj.retention --years 3 --mode anonymize [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+from collections import Counter
+from datetime import date, datetime
+
+from jdj.config import HISTORY_SUMMARY_FILE, REGISTRATIONS_FILE
+from jdj.events import load_events, load_registrations, replace_registrations
+from jdj.storage import atomic_write_json, file_lock, load_data
+
+# Champs retirés des inscriptions anonymisées
+PERSONAL_FIELDS = ('nom', 'prenom', 'email', 'date_naissance')
+
+# Du plus léger au plus strict : un événement n'est retraité que pour un mode plus strict
+MODES = ['anonymize', 'aggregate', 'purge']
+MODE_LABELS = {
+    'anonymize': "Anonymiser",
+    'aggregate': "Garder les effectifs et années de naissance",
+    'purge': "Supprimer (effectifs seulement)",
+}
+
+
+def _summary_lock_path():
+    return HISTORY_SUMMARY_FILE + ".lock"
+
+def load_history_summary():
+    """Résumé des événements déjà traités, par identifiant d'événement"""
+    return load_data(HISTORY_SUMMARY_FILE)
+
+def _save_event_summary(event_id, summary):
+    with file_lock(_summary_lock_path()):
+        summaries = load_data(HISTORY_SUMMARY_FILE)
+        summaries[event_id] = summary
+        atomic_write_json(summaries, HISTORY_SUMMARY_FILE)
+
+def cutoff_date(years, today=None):
+    """Date avant laquelle un événement est concerné par la rétention"""
+    today = today or date.today()
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:  # 29 février
+        return today.replace(year=today.year - years, day=28)
+
+def expired_events(years, mode, today=None):
+    """Événements à traiter, du plus ancien au plus récent"""
+    limit = str(cutoff_date(years, today))
+    summaries = load_history_summary()
+    for event in sorted(load_events(), key=lambda e: e['date']):
+        if event['date'] >= limit:
+            continue
+        done = summaries.get(event['id'], {}).get('mode')
+        if done in MODES and MODES.index(done) >= MODES.index(mode):
+            continue
+        yield event
+
+def birth_year(reg):
+    """Année de naissance d'une inscription, anonymisée ou non ('' si inconnue)"""
+    return reg.get('annee_naissance') or str(reg.get('date_naissance') or '')[:4]
+
+def summarize(registrations, previous=None):
+    """Effectifs d'un événement, complétés par un éventuel résumé précédent"""
+    birth_years = Counter(birth_year(reg) for reg in registrations)
+    birth_years.pop('', None)
+    summary = {
+        'total': len(registrations),
+        'confirmed': len([reg for reg in registrations if reg['confirmed']]),
+        'waitlisted': len([reg for reg in registrations if reg.get('waitlisted')]),
+        'birth_years': dict(sorted(birth_years.items())),
+    }
+    # Un événement déjà vidé garde les effectifs de son premier traitement
+    if previous and not registrations:
+        summary.update({k: previous[k] for k in summary if k in previous})
+    return summary
+
+def anonymize(reg):
+    """Retire les données personnelles d'une inscription
+
+    Les champs personnels sont supprimés plutôt que vidés, pour que le
+    fichier rétrécisse ; ``annee_naissance`` marque l'inscription comme
+    anonymisée.
+    """
+    anonymized = {key: value for key, value in reg.items() if key not in PERSONAL_FIELDS}
+    anonymized['annee_naissance'] = birth_year(reg)
+    anonymized['date_inscription'] = str(reg.get('date_inscription') or '')[:10]
+    return anonymized
+
+def _strip_legacy_year(event_id):
+    """Retire une année de la copie de l'ancien fichier ; retourne les octets libérés"""
+    if not os.path.exists(REGISTRATIONS_FILE):
+        return 0
+    legacy = load_data(REGISTRATIONS_FILE)
+    if event_id not in legacy:
+        return 0
+    size_before = os.path.getsize(REGISTRATIONS_FILE)
+    del legacy[event_id]
+    atomic_write_json(legacy, REGISTRATIONS_FILE)
+    return size_before - os.path.getsize(REGISTRATIONS_FILE)
+
+def process_event(event, mode, dry_run=False):
+    """Applique la politique à un événement et retourne son rapport"""
+    previous = load_history_summary().get(event['id'])
+    report = {'event': event, 'mode': mode, 'bytes_reclaimed': 0}
+
+    if dry_run:
+        report['summary'] = summarize(load_registrations(event['id']), previous)
+        return report
+
+    summary = {}
+
+    def transform(registrations):
+        summary.update(summarize(registrations, previous))
+        if mode == 'anonymize':
+            return [anonymize(reg) for reg in registrations]
+        return []
+
+    size_before, size_after = replace_registrations(event['id'], transform)
+    if mode == 'purge':
+        summary.pop('birth_years')
+    summary.update({'mode': mode, 'processed_at': str(datetime.now())})
+    _save_event_summary(event['id'], summary)
+
+    report['summary'] = summary
+    report['bytes_reclaimed'] = size_before - size_after + _strip_legacy_year(event['id'])
+    return report
+
+def run_retention(years, mode, today=None, dry_run=False):
+    """Traite les événements expirés un par un et produit un rapport par événement"""
+    if mode not in MODES:
+        raise ValueError(f"Mode inconnu : {mode!r} (attendu : {', '.join(MODES)})")
+    for event in list(expired_events(years, mode, today)):
+        yield process_event(event, mode, dry_run)
+
+def format_bytes(size):
+    """Taille lisible (octets, Ko, Mo)"""
+    if size < 1024:
+        return f"{size} octets"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} Ko"
+    return f"{size / 1024 / 1024:.1f} Mo"
+
+def format_reclaimed(size):
+    """Place libérée, ou ajoutée si les fichiers ont grossi"""
+    if size < 0:
+        return f"{format_bytes(-size)} ajoutés"
+    return f"{format_bytes(size)} libérés"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Applique la politique de rétention des inscriptions")
+    parser.add_argument("--years", type=int, required=True,
+                        help="âge (en années) à partir duquel un événement est traité")
+    parser.add_argument("--mode", choices=MODES, default='anonymize', help="traitement appliqué")
+    parser.add_argument("--data-dir", default=".", help="dossier des données")
+    parser.add_argument("--dry-run", action="store_true", help="afficher sans rien modifier")
+    args = parser.parse_args(argv)
+
+    os.chdir(args.data_dir)
+
+    total = 0
+    count = 0
+    for report in run_retention(args.years, args.mode, dry_run=args.dry_run):
+        summary = report['summary']
+        count += 1
+        total += report['bytes_reclaimed']
+        print(f"{report['event']['id']} : {summary['confirmed']}/{summary['total']} confirmées"
+              + ("" if args.dry_run else f", {format_reclaimed(report['bytes_reclaimed'])}"))
+
+    if not count:
+        print("Aucun événement à traiter")
+    elif args.dry_run:
+        print(f"{count} événement(s) seraient traités (mode {args.mode})")
+    else:
+        print(f"{count} événement(s) traités (mode {args.mode}), {format_reclaimed(total)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
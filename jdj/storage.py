@@ -0,0 +1,92 @@
+"""Lecture et écriture des fichiers de données JSON.
+
+Les fichiers sont partagés par tous les processus Streamlit lancés sur le
+même dossier de données : les écritures passent par un fichier temporaire
+renommé atomiquement, et les lectures en cache sont indexées par la
+signature du fichier sur disque (inode, date de modification, taille). Une
+écriture faite par un autre processus change cette signature et invalide
+donc le cache de chaque processus à sa prochaine lecture.
+"""
+
+import fcntl
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+import streamlit as st
+
+from jdj.config import IMAGE_CONFIG_FILE
+
+
+def load_data(filename):
+    """Charge les données depuis un fichier JSON"""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_data(data, filename):
+    """Sauvegarde les données dans un fichier JSON"""
+    atomic_write_json(data, filename)
+
+def file_version(filename):
+    """Signature d'un fichier sur disque, qui change à chaque écriture
+
+    Chaque écriture atomique crée un nouvel inode : la signature change même
+    si deux écritures tombent dans la même unité de temps. Retourne None si
+    le fichier n'existe pas.
+    """
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _load_data_version(filename, version):
+    return load_data(filename)
+
+def load_cached(filename):
+    """Charge un fichier JSON via le cache, invalidé dès que le fichier change"""
+    return _load_data_version(filename, file_version(filename))
+
+def atomic_write_json(data, filename):
+    """Écrit un fichier JSON de façon atomique (fichier temporaire puis renommage)
+
+    Un lecteur voit toujours soit l'ancienne, soit la nouvelle version
+    complète du fichier, jamais une écriture à moitié terminée.
+    """
+    directory = os.path.dirname(filename) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        os.chmod(tmp_path, 0o644)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+@contextmanager
+def file_lock(lock_path):
+    """Verrou exclusif sur un fichier, valable entre threads et processus"""
+    directory = os.path.dirname(lock_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(lock_path, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def load_image_config():
+    """Charge la configuration de l'image"""
+    return load_cached(IMAGE_CONFIG_FILE) or {"image_type": "none", "image_url": "", "image_path": "", "image_caption": ""}
+
+def save_image_config(config):
+    """Sauvegarde la configuration de l'image"""
+    atomic_write_json(config, IMAGE_CONFIG_FILE)
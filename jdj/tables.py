@@ -0,0 +1,119 @@
+"""Tableaux des inscriptions pour le tableau de bord, gardés en cache.
+
+Chaque événement a un DataFrame typé (textes et dates Arrow, statut
+catégoriel, identifiant d'inscription en index), construit une fois par
+version des données et partagé par les sessions du processus. Après une
+confirmation ou une suppression faite par ce processus, le tableau est
+modifié sur place au lieu d'être reconstruit ; une écriture venue d'un autre
+processus change la version et provoque une reconstruction.
+
+Ce module importe pandas : il n'est chargé que depuis le tableau de bord.
+"""
+
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+from jdj.events import data_version, load_registrations
+
+CONFIRMED = "confirmée"
+PENDING = "en attente"
+WAITLISTED = "liste d'attente"
+STATUS_DTYPE = pd.CategoricalDtype([CONFIRMED, PENDING, WAITLISTED])
+
+STRING_DTYPE = pd.ArrowDtype(pa.string())
+DATE_DTYPE = pd.ArrowDtype(pa.date32())
+
+DISPLAY_COLUMNS = ['Prénom', 'Nom', 'Email', 'Date de naissance', 'Date d\'inscription']
+
+
+@st.cache_resource
+def _tables():
+    """Tableaux par événement, partagés par les sessions du processus"""
+    return {'lock': threading.Lock(), 'events': {}}
+
+def _status(reg):
+    if reg.get('waitlisted'):
+        return WAITLISTED
+    return CONFIRMED if reg['confirmed'] else PENDING
+
+def build_table(registrations):
+    """Construit le DataFrame typé des inscriptions d'un événement"""
+    df = pd.DataFrame({
+        # Champs absents des inscriptions anonymisées : valeurs vides
+        'Prénom': pd.Series([reg.get('prenom') for reg in registrations], dtype=STRING_DTYPE),
+        'Nom': pd.Series([reg.get('nom') for reg in registrations], dtype=STRING_DTYPE),
+        'Email': pd.Series([reg.get('email') for reg in registrations], dtype=STRING_DTYPE),
+        # Format exact : une année seule (anonymisation antérieure) reste vide
+        'Date de naissance': pd.to_datetime(
+            pd.Series([reg.get('date_naissance') for reg in registrations], dtype=object),
+            format='%Y-%m-%d', errors='coerce'
+        ).astype(DATE_DTYPE),
+        'Date d\'inscription': pd.to_datetime(
+            pd.Series([reg['date_inscription'] for reg in registrations], dtype=object),
+            format='ISO8601', errors='coerce'
+        ),
+        'Statut': pd.Categorical([_status(reg) for reg in registrations], dtype=STATUS_DTYPE),
+    })
+    df.index = pd.Index([reg['id'] for reg in registrations], name='id')
+    return df
+
+def _entry(event_id):
+    """Entrée en cache d'un événement, reconstruite si les données ont changé"""
+    version = data_version(event_id)
+    tables = _tables()
+    with tables['lock']:
+        entry = tables['events'].get(event_id)
+        if entry is None or entry['version'] != version:
+            entry = {'version': version, 'table': build_table(load_registrations(event_id)), 'confirmed': None}
+            tables['events'][event_id] = entry
+        return entry
+
+def confirmed_table(event_id):
+    """Inscriptions confirmées d'un événement, prêtes pour ``st.dataframe``
+
+    Le résultat est gardé jusqu'à la prochaine modification des données.
+    """
+    entry = _entry(event_id)
+    with _tables()['lock']:
+        if entry['confirmed'] is None:
+            table = entry['table']
+            entry['confirmed'] = table.loc[table['Statut'] == CONFIRMED, DISPLAY_COLUMNS]
+        return entry['confirmed']
+
+def _patch(event_id, versions, apply):
+    """Applique une modification au tableau en cache s'il était à jour
+
+    Si le tableau n'était pas à la version précédant l'écriture, une autre
+    modification a eu lieu entre-temps : il est simplement oublié et sera
+    reconstruit à la prochaine lecture.
+    """
+    tables = _tables()
+    with tables['lock']:
+        entry = tables['events'].get(event_id)
+        if entry is None:
+            return
+        if entry['version'] != versions['before']:
+            del tables['events'][event_id]
+            return
+        if versions['after'] != versions['before']:
+            apply(entry['table'])
+            entry['version'] = versions['after']
+            entry['confirmed'] = None
+
+def patch_confirmed(event_id, registration_id, versions):
+    """Reporte une confirmation dans le tableau en cache"""
+    def apply(table):
+        table.loc[registration_id, 'Statut'] = CONFIRMED
+    _patch(event_id, versions, apply)
+
+def patch_deleted(event_id, registration_id, result):
+    """Reporte une suppression (et les promotions qui ont suivi) dans le tableau en cache"""
+    def apply(table):
+        table.drop(index=registration_id, inplace=True, errors='ignore')
+        promoted = [reg['id'] for reg in result['promoted']]
+        if promoted:
+            table.loc[promoted, 'Statut'] = PENDING
+    _patch(event_id, result, apply)
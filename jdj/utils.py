@@ -0,0 +1,31 @@
+"""Fonctions utilitaires (validation, captcha, mots de passe)"""
+
+import hashlib
+import random
+import re
+
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+
+
+def validate_email(email):
+    """Valide le format de l'email"""
+    return re.match(EMAIL_PATTERN, email) is not None
+
+def generate_captcha():
+    """Génère un captcha simple"""
+    num1 = random.randint(1, 10)
+    num2 = random.randint(1, 10)
+    operation = random.choice(['+', '-', '*'])
+    
+    if operation == '+':
+        result = num1 + num2
+    elif operation == '-':
+        result = num1 - num2
+    else:  # multiplication
+        result = num1 * num2
+    
+    return f"{num1} {operation} {num2}", result
+
+def hash_password(password):
+    """Hash un mot de passe"""
+    return hashlib.sha256(password.encode()).hexdigest()
@@ -0,0 +1 @@
+"""Pages de l'application, importées à la demande par ``streamlit_app.py``."""
@@ -0,0 +1,46 @@
+"""Page d'accueil"""
+
+import streamlit as st
+
+from jdj.display import display_custom_content, display_image_from_config, select_event
+from jdj.events import upcoming_events, spots_left
+
+
+def home_page():
+    """Page d'accueil"""
+    st.title("Journée de la jeunesse")
+    st.markdown("---")
+    
+    # Configuration en deux colonnes principales
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        # Affichage du contenu personnalisé dans la colonne de gauche
+        display_custom_content()
+        
+        # Événement à venir sélectionné et sa description
+        event = select_event(upcoming_events(), "Choisir l'événement", key="home_event")
+        if event is None:
+            st.info("Aucun événement n'est ouvert aux inscriptions pour le moment.")
+        else:
+            st.subheader(event['nom'])
+            st.write(f"📅 {event['date']}")
+            remaining = spots_left(event)
+            if remaining == 0:
+                st.warning("Complet : inscription sur liste d'attente")
+            elif remaining is not None:
+                st.write(f"🎟️ Places restantes : {remaining}")
+            if event.get('contenu'):
+                st.markdown(event['contenu'])
+            
+            # Espace au-dessus du bouton
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # Bouton d'inscription
+            if st.button("S'inscrire à l'événement", type="primary", use_container_width=True):
+                st.session_state.page = 'inscription'
+                st.rerun()
+    
+    with col2:
+        # Affichage de l'image principale dans la colonne de droite
+        display_image_from_config()
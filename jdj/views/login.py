@@ -0,0 +1,23 @@
+"""Page de connexion pour les modérateurs"""
+
+import streamlit as st
+
+from jdj.config import DEFAULT_MODERATOR_PASSWORD
+from jdj.utils import hash_password
+
+
+def moderator_login():
+    """Page de connexion pour les modérateurs"""
+    st.title("Connexion Modérateur")
+    
+    with st.form("login_form"):
+        password = st.text_input("Mot de passe", type="password")
+        submit = st.form_submit_button("Se connecter")
+        
+        if submit:
+            if hash_password(password) == hash_password(DEFAULT_MODERATOR_PASSWORD):
+                st.session_state.logged_in = True
+                st.success("Connexion réussie !")
+                st.rerun()
+            else:
+                st.error("Mot de passe incorrect")
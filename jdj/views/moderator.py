@@ -0,0 +1,851 @@
+"""Tableau de bord des modérateurs.
+
+Ce module importe pandas et le traitement d'images : il n'est chargé
+qu'une fois le modérateur connecté.
+"""
+
+import os
+from datetime import date
+
+import streamlit as st
+
+from jdj.bulk_import import prepare_import, to_registrations
+from jdj.config import IMAGES_FOLDER, REFRESH_SECONDS
+from jdj.content import (
+    current_content_version, load_content_version, list_content_versions,
+    publish_content, rollback_content, referenced_images,
+)
+from jdj.display import display_custom_content, display_image_from_config, select_event
+from jdj.events import (
+    new_event, load_events, save_event, make_event_id, event_label,
+    load_registrations, load_counter, data_version,
+    confirm_registration, delete_registration, promote_waitlist, import_registrations,
+)
+from jdj.images import ingest_uploaded_image, memory_report, save_uploaded_image
+from jdj.storage import (
+    load_image_config, save_image_config,
+)
+from jdj.retention import MODES, MODE_LABELS, format_reclaimed, load_history_summary, run_retention
+from jdj.tables import confirmed_table, patch_confirmed, patch_deleted
+
+# Lignes dessinées par page dans les listes d'inscriptions en attente
+PAGE_SIZE = 50
+
+
+def registration_summary(reg):
+    """Affiche les informations d'une inscription"""
+    if reg.get('email'):
+        st.write(f"**{reg['prenom']} {reg['nom']}**")
+        st.write(f"Email: {reg['email']}")
+    else:
+        st.write("**Inscription anonymisée**")
+    if reg.get('date_naissance'):
+        st.write(f"Né(e) le {reg['date_naissance']}")
+    elif reg.get('annee_naissance'):
+        st.write(f"Né(e) en {reg['annee_naissance']}")
+    st.write(f"Inscrit le {reg['date_inscription'][:10]}")
+
+def delete_button(event, reg):
+    """Bouton de suppression ; une place libérée est reprise par la liste d'attente"""
+    if st.button("Supprimer", key=f"delete_reg_{reg['id']}"):
+        result = delete_registration(event, reg['id'])
+        patch_deleted(event['id'], reg['id'], result)
+        st.success("Inscription supprimée !")
+        for p in result['promoted']:
+            st.info(f"{p.get('prenom', '')} {p.get('nom', '')} quitte la liste d'attente")
+        st.rerun()
+
+def pending_rows(event):
+    """Inscriptions en attente et liste d'attente, relues seulement si les données ont changé
+
+    La version des données est lue à chaque appel (un simple ``stat``) ; les
+    listes ne sont reconstruites que si elle a changé. Les nouvelles
+    inscriptions depuis la lecture précédente sont signalées.
+    """
+    version = data_version(event['id'])
+    cache = st.session_state.setdefault('pending_rows', {})
+    rows = cache.get(event['id'])
+    
+    if rows is None or rows['version'] != version:
+        registrations = load_registrations(event['id'])
+        new_rows = {
+            'version': version,
+            'pending': [reg for reg in registrations if not reg['confirmed'] and not reg.get('waitlisted')],
+            'waitlist': [reg for reg in registrations if reg.get('waitlisted')],
+            'ids': {reg['id'] for reg in registrations},
+        }
+        if rows is not None:
+            added = len(new_rows['ids'] - rows['ids'])
+            if added:
+                st.toast(f"🔔 {added} nouvelle(s) inscription(s)")
+        rows = cache[event['id']] = new_rows
+    return rows
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def watch_pending(event):
+    """Relance le tableau de bord quand les inscriptions de l'événement changent
+
+    Seul ce fragment tourne périodiquement : il compare la version des
+    données (un ``stat``) à celle de la liste affichée et ne dessine rien.
+    """
+    shown = st.session_state.get('pending_rows', {}).get(event['id'])
+    if shown is not None and shown['version'] != data_version(event['id']):
+        st.rerun()
+
+def page_of(rows, key):
+    """Tranche de ``rows`` à afficher, avec un sélecteur de page si nécessaire"""
+    pages = max((len(rows) - 1) // PAGE_SIZE + 1, 1)
+    if pages == 1:
+        return rows, 0
+    page = st.number_input(f"Page (sur {pages})", min_value=1, max_value=pages, value=1, key=key)
+    start = (min(page, pages) - 1) * PAGE_SIZE
+    return rows[start:start + PAGE_SIZE], start
+
+@st.fragment
+def pending_tab(event):
+    """Inscriptions en attente de validation et liste d'attente d'un événement
+
+    Les inscriptions ne sont relues que si leur version a changé, et seules
+    ``PAGE_SIZE`` lignes par liste sont dessinées. Chaque ligne garde une
+    clé stable (identifiant de l'inscription), si bien que seules les lignes
+    ajoutées ou retirées changent à l'écran. Le rafraîchissement périodique
+    est fait par ``watch_pending``.
+    """
+    st.header("Inscriptions en attente de validation")
+    
+    rows = pending_rows(event)
+    pending, waitlist = rows['pending'], rows['waitlist']
+    
+    if not pending:
+        st.info("Aucune inscription en attente de validation.")
+    elif len(pending) > PAGE_SIZE:
+        st.write(f"{len(pending)} inscriptions en attente")
+    
+    shown, _ = page_of(pending, f"pending_page_{event['id']}")
+    for reg in shown:
+        with st.container(key=f"pending_row_{reg['id']}"):
+            col1, col2, col3 = st.columns([3, 1, 1])
+            
+            with col1:
+                registration_summary(reg)
+            
+            with col2:
+                if st.button("Confirmer", key=f"confirm_{reg['id']}"):
+                    # Confirmer l'inscription
+                    versions = confirm_registration(event['id'], reg['id'])
+                    patch_confirmed(event['id'], reg['id'], versions)
+                    st.success("Inscription confirmée !")
+                    st.rerun()
+            
+            with col3:
+                delete_button(event, reg)
+            
+            st.markdown("---")
+    
+    if waitlist:
+        st.subheader(f"Liste d'attente ({len(waitlist)})")
+        
+        shown, offset = page_of(waitlist, f"waitlist_page_{event['id']}")
+        for position, reg in enumerate(shown, start=offset + 1):
+            with st.container(key=f"waitlist_row_{reg['id']}"):
+                col1, col2 = st.columns([4, 1])
+                
+                with col1:
+                    st.write(f"**#{position}**")
+                    registration_summary(reg)
+                
+                with col2:
+                    delete_button(event, reg)
+                
+                st.markdown("---")
+
+def confirmed_tab(event):
+    """Inscriptions confirmées pour un événement"""
+    st.header("Inscriptions confirmées")
+    
+    counter = load_counter(event['id'])
+    confirmed_count = counter['confirmed']
+    
+    if event.get('capacite'):
+        st.write(f"Places occupées : {counter['occupied']}/{event['capacite']} "
+                 f"— liste d'attente : {counter['waitlisted']}")
+    
+    if not confirmed_count:
+        st.info("Aucune inscription confirmée pour cet événement.")
+    else:
+        st.success(f"**{confirmed_count} inscription(s) confirmée(s) pour {event['nom']}**")
+        
+        # Affichage sous forme de tableau (gardé en cache entre les réexécutions)
+        st.dataframe(confirmed_table(event['id']), use_container_width=True, hide_index=True)
+
+def history_tab(events, event):
+    """Historique des autres événements"""
+    st.header("Historique des autres événements")
+    
+    others = [e for e in events if e['id'] != event['id']]
+    if not others:
+        st.info("Aucun historique disponible.")
+        return
+    
+    summaries = load_history_summary()
+    for other in others:
+        summary = summaries.get(other['id'])
+        if summary and summary['mode'] != 'anonymize':
+            # Inscriptions supprimées : seuls les effectifs ont été conservés
+            with st.expander(f"{event_label(other)} - {summary['confirmed']}/{summary['total']} confirmées (archivé)"):
+                st.info(f"Inscriptions supprimées le {summary['processed_at'][:10]} (politique de rétention).")
+                if summary.get('birth_years'):
+                    st.bar_chart(summary['birth_years'], x_label="Année de naissance", y_label="Inscriptions")
+            continue
+        
+        counter = load_counter(other['id'])
+        confirmed_count = counter['confirmed']
+        total_count = counter['occupied'] + counter['waitlisted']
+        
+        with st.expander(f"{event_label(other)} - {confirmed_count}/{total_count} confirmées"):
+            if summary:
+                # Dates de naissance effacées : seule la répartition par année reste
+                st.caption(f"Inscriptions anonymisées le {summary['processed_at'][:10]}.")
+                if summary.get('birth_years'):
+                    st.bar_chart(summary['birth_years'], x_label="Année de naissance", y_label="Inscriptions")
+            if confirmed_count:
+                st.dataframe(confirmed_table(other['id']), use_container_width=True, hide_index=True)
+            else:
+                st.info("Aucune inscription confirmée pour cet événement.")
+    
+    retention_section()
+
+def retention_section():
+    """Application de la politique de rétention aux anciens événements"""
+    st.subheader("Rétention des données")
+    st.write("Les inscriptions des événements plus anciens que le délai choisi sont traitées "
+             "un événement à la fois ; les effectifs restent visibles ci-dessus.")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        years = st.number_input("Événements de plus de (années)", min_value=1, value=3, step=1,
+                                key="retention_years")
+    with col2:
+        mode = st.selectbox("Traitement", MODES, format_func=MODE_LABELS.get, key="retention_mode")
+    dry_run = st.checkbox("Simulation (ne rien modifier)", value=True, key="retention_dry_run")
+    
+    if st.button("Appliquer la politique de rétention", key="retention_run"):
+        progress = st.container()
+        total = 0
+        count = 0
+        for report in run_retention(int(years), mode, dry_run=dry_run):
+            summary = report['summary']
+            count += 1
+            total += report['bytes_reclaimed']
+            progress.write(f"{event_label(report['event'])} : {summary['total']} inscription(s)")
+        
+        if not count:
+            st.info("Aucun événement à traiter.")
+        elif dry_run:
+            st.info(f"{count} événement(s) seraient traités.")
+        else:
+            st.success(f"{count} événement(s) traités, {format_reclaimed(total)}.")
+
+def export_tab(events):
+    """Export des adresses email confirmées d'un événement"""
+    st.header("Export des adresses email")
+    
+    if not events:
+        st.info("Aucune donnée disponible pour l'export.")
+        return
+    
+    by_id = {e['id']: e for e in events}
+    selected_id = st.selectbox(
+        "Choisir l'événement",
+        list(by_id),
+        index=0,
+        format_func=lambda event_id: event_label(by_id[event_id]),
+        key="export_event"
+    )
+    selected = by_id[selected_id]
+    # Les inscriptions anonymisées n'ont plus d'adresse
+    emails = [email for email in confirmed_table(selected_id)['Email'].dropna().tolist() if email]
+    
+    if emails:
+        emails_text = "; ".join(emails)
+        
+        st.success(f"**{len(emails)} adresse(s) email confirmée(s) pour {selected['nom']}**")
+        
+        # Zone de texte avec les emails
+        st.text_area(
+            "Adresses email (séparées par des points-virgules)",
+            value=emails_text,
+            height=150
+        )
+        
+        # Bouton de copie (information)
+        st.info("Vous pouvez sélectionner le texte ci-dessus et le copier avec Ctrl+C")
+        
+        # Download button
+        st.download_button(
+            label="Télécharger la liste des emails",
+            data=emails_text,
+            file_name=f"emails_{selected_id}.txt",
+            mime="text/plain"
+        )
+    else:
+        st.info(f"Aucune inscription confirmée pour {selected['nom']}.")
+
+def events_tab(events):
+    """Création et modification des événements"""
+    st.header("Gestion des événements")
+    
+    by_id = {e['id']: e for e in events}
+    choice = st.selectbox(
+        "Événement à modifier",
+        [None] + list(by_id),
+        format_func=lambda event_id: "➕ Nouvel événement" if event_id is None else event_label(by_id[event_id]),
+        key="edit_event"
+    )
+    event = by_id.get(choice)
+    
+    with st.form("event_form"):
+        nom = st.text_input("Nom de l'événement *", value=event['nom'] if event else "Journée de la jeunesse")
+        date_event = st.date_input(
+            "Date de l'événement *",
+            value=date.fromisoformat(event['date']) if event else date.today()
+        )
+        capacite = st.number_input(
+            "Capacité (0 = illimitée)",
+            min_value=0,
+            value=(event.get('capacite') or 0) if event else 0
+        )
+        contenu = st.text_area(
+            "Description (Markdown, affichée sur la page d'accueil)",
+            value=event.get('contenu', "") if event else "",
+            height=100
+        )
+        
+        submitted = st.form_submit_button("💾 Enregistrer l'événement", type="primary")
+        
+        if submitted:
+            if not nom.strip():
+                st.error("Le nom de l'événement est obligatoire")
+            else:
+                event_id = event['id'] if event else make_event_id(date_event)
+                saved = new_event(event_id, nom.strip(), date_event, capacite or None, contenu.strip())
+                save_event(saved)
+                # Une hausse de capacité libère des places pour la liste d'attente
+                promote_waitlist(saved)
+                st.success("✅ Événement enregistré !")
+                st.rerun()
+
+def import_tab(event):
+    """Import en masse d'inscriptions (papier, téléphone) depuis un fichier"""
+    st.header("Import en masse")
+    st.info("💡 Colonnes attendues : email, nom, prénom, date de naissance. "
+            "Fichier CSV (séparateur , ou ;) ou XLSX, une ligne par personne.")
+    
+    uploaded_file = st.file_uploader(
+        "Choisir un fichier",
+        type=['csv', 'xlsx'],
+        key="bulk_import_file"
+    )
+    if uploaded_file is None:
+        return
+    
+    # La validation n'est faite qu'une fois par fichier et par événement
+    key = (event['id'], uploaded_file.file_id)
+    preview = st.session_state.get('bulk_import')
+    if preview is None or preview['key'] != key:
+        try:
+            existing = [reg.get('email', '') for reg in load_registrations(event['id'])]
+            accepted, rejected = prepare_import(uploaded_file, existing)
+        except ImportError:
+            st.error("La lecture des fichiers XLSX nécessite le paquet openpyxl")
+            return
+        except ValueError as e:
+            st.error(f"Fichier illisible : {e}")
+            return
+        preview = {'key': key, 'accepted': accepted, 'rejected': rejected, 'result': None}
+        st.session_state.bulk_import = preview
+    
+    accepted, rejected = preview['accepted'], preview['rejected']
+    
+    if preview['result']:
+        result = preview['result']
+        st.success(f"✅ {result['inscrit']} inscription(s) importée(s), "
+                   f"{result['attente']} sur liste d'attente, {result['doublon']} doublon(s) ignoré(s)")
+        return
+    
+    col1, col2 = st.columns(2)
+    col1.metric("Lignes acceptées", len(accepted))
+    col2.metric("Lignes rejetées", len(rejected))
+    
+    if len(rejected):
+        st.subheader("Lignes rejetées")
+        st.dataframe(rejected.head(1000), use_container_width=True)
+        st.download_button(
+            label="Télécharger les lignes rejetées",
+            data=rejected.to_csv(sep=';').encode('utf-8'),
+            file_name="import_rejets.csv",
+            mime="text/csv"
+        )
+    
+    if not len(accepted):
+        st.warning("Aucune ligne à importer.")
+        return
+    
+    st.subheader("Aperçu des lignes acceptées")
+    st.dataframe(accepted.head(20), use_container_width=True)
+    
+    confirmed = st.checkbox("Marquer les inscriptions importées comme confirmées", key="bulk_import_confirmed")
+    if st.button(f"📥 Importer {len(accepted)} inscription(s)", type="primary"):
+        preview['result'] = import_registrations(event, to_registrations(accepted, confirmed))
+        st.rerun()
+
+def content_draft(refresh=False):
+    """Brouillon du contenu personnalisé, gardé en session jusqu'à publication
+
+    Avec ``refresh``, un brouillon sans modification repart de la version
+    publiée si un autre modérateur a publié ou est revenu en arrière
+    entre-temps. Les boutons d'édition ne rafraîchissent pas : ils
+    s'appliquent au brouillon affiché.
+    """
+    draft = st.session_state.get('content_draft')
+    stale = refresh and draft is not None and not draft['changes'] and (
+        draft['base_version'] != current_content_version()
+    )
+    if draft is None or stale:
+        version = current_content_version()
+        st.session_state.content_draft = {
+            'base_version': version,
+            'elements': load_content_version(version).get("elements", []),
+            'changes': 0,
+        }
+    return st.session_state.content_draft
+
+def discard_content_draft():
+    """Abandonne le brouillon ; le prochain repartira de la version publiée"""
+    st.session_state.pop('content_draft', None)
+
+def move_draft_element(i, j):
+    """Échange deux éléments du brouillon"""
+    draft = content_draft()
+    elements = draft['elements']
+    elements[i], elements[j] = elements[j], elements[i]
+    draft['changes'] += 1
+
+def remove_draft_element(i):
+    """Retire un élément du brouillon"""
+    draft = content_draft()
+    draft['elements'].pop(i)
+    draft['changes'] += 1
+
+def clear_draft_elements():
+    """Vide le brouillon"""
+    draft = content_draft()
+    draft['elements'] = []
+    draft['changes'] += 1
+
+def content_tab():
+    """Édition du contenu personnalisé par brouillon puis publication"""
+    st.header("Gestion du contenu personnalisé")
+    st.info("💡 Ce contenu apparaîtra dans la colonne de gauche de la page d'accueil, à côté de l'image")
+    
+    draft = content_draft(refresh=True)
+    elements = draft['elements']
+    
+    # État du brouillon et publication
+    st.write(f"**Version publiée :** {current_content_version()}")
+    if draft['changes']:
+        st.warning(f"📝 Brouillon : {draft['changes']} modification(s) non publiée(s), "
+                   "invisibles pour les visiteurs jusqu'à la publication")
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🚀 Publier le brouillon", type="primary", use_container_width=True):
+                try:
+                    version = publish_content(elements, draft['base_version'])
+                except ValueError as e:
+                    st.error(f"Publication impossible : {e}. Abandonnez le brouillon pour repartir de la version publiée.")
+                else:
+                    discard_content_draft()
+                    st.success(f"✅ Version {version} publiée !")
+                    st.rerun()
+        with col2:
+            st.button("↩️ Abandonner le brouillon", on_click=discard_content_draft, use_container_width=True)
+    
+    # Prévisualisation du brouillon
+    if elements:
+        st.subheader("📋 Prévisualisation")
+        with st.container():
+            st.markdown("---")
+            display_custom_content(elements)
+            st.markdown("---")
+    else:
+        st.info("Aucun contenu personnalisé configuré")
+    
+    st.subheader("➕ Ajouter un nouvel élément")
+    
+    with st.form("add_content_element"):
+        element_type = st.selectbox(
+            "Type d'élément",
+            ["text", "image", "spacer"],
+            format_func=lambda x: {
+                "text": "📝 Texte",
+                "image": "🖼️ Image", 
+                "spacer": "📏 Espace"
+            }[x]
+        )
+        
+        if element_type == "text":
+            text_style = st.selectbox(
+                "Style de texte",
+                ["normal", "header", "subheader", "markdown"],
+                format_func=lambda x: {
+                    "normal": "Texte normal",
+                    "header": "Titre principal",
+                    "subheader": "Sous-titre",
+                    "markdown": "Markdown (formatage avancé)"
+                }[x]
+            )
+            
+            if text_style == "markdown":
+                st.info("💡 Vous pouvez utiliser la syntaxe Markdown : **gras**, *italique*, [lien](url), etc.")
+            
+            text_content = st.text_area(
+                "Contenu du texte",
+                placeholder="Entrez votre texte ici...",
+                height=100
+            )
+            
+        elif element_type == "image":
+            image_source = st.radio(
+                "Source de l'image",
+                ["url", "local"],
+                format_func=lambda x: {"url": "🌐 URL", "local": "📁 Fichier local"}[x]
+            )
+            
+            image_url = ""
+            uploaded_image = None
+            
+            if image_source == "url":
+                image_url = st.text_input(
+                    "URL de l'image",
+                    placeholder="https://exemple.com/image.jpg"
+                )
+            else:
+                uploaded_image = st.file_uploader(
+                    "Choisir une image",
+                    type=['png', 'jpg', 'jpeg', 'gif', 'bmp'],
+                    key="content_image_uploader"
+                )
+            
+            image_caption = st.text_input("Légende (optionnel)")
+            image_width = st.number_input("Largeur de l'image (pixels, 0 = automatique)", min_value=0, max_value=800, value=0)
+            
+        elif element_type == "spacer":
+            spacer_height = st.number_input("Hauteur de l'espace (pixels)", min_value=10, max_value=200, value=30)
+        
+        add_element = st.form_submit_button("➕ Ajouter l'élément", type="primary")
+        
+        if add_element:
+            new_element = {"type": element_type}
+            
+            if element_type == "text":
+                if not text_content.strip():
+                    st.error("Le contenu du texte ne peut pas être vide")
+                else:
+                    new_element.update({
+                        "style": text_style,
+                        "content": text_content.strip()
+                    })
+                    
+            elif element_type == "image":
+                if image_source == "url":
+                    if not image_url.strip():
+                        st.error("L'URL de l'image ne peut pas être vide")
+                    else:
+                        new_element.update({
+                            "image_type": "url",
+                            "image_url": image_url.strip(),
+                            "caption": image_caption.strip(),
+                            "width": image_width if image_width > 0 else None
+                        })
+                else:  # local
+                    if uploaded_image is None:
+                        st.error("Veuillez sélectionner une image")
+                    else:
+                        saved_path = save_uploaded_image(uploaded_image)
+                        if saved_path:
+                            new_element.update({
+                                "image_type": "local",
+                                "image_path": saved_path,
+                                "caption": image_caption.strip(),
+                                "width": image_width if image_width > 0 else None
+                            })
+                        else:
+                            st.error("Erreur lors de la sauvegarde de l'image")
+                            st.stop()
+                            
+            elif element_type == "spacer":
+                new_element.update({
+                    "height": spacer_height
+                })
+            
+            # Ajouter l'élément au brouillon
+            if "content" in new_element or "image_url" in new_element or "image_path" in new_element or "height" in new_element:
+                elements.append(new_element)
+                draft['changes'] += 1
+                st.rerun()
+    
+    # Gestion des éléments existants (modifie seulement le brouillon)
+    if elements:
+        st.subheader("🗂️ Gérer les éléments existants")
+        
+        for i, element in enumerate(elements):
+            with st.expander(f"Élément {i+1} - {element['type'].title()}", expanded=False):
+                col1, col2, col3 = st.columns([2, 1, 1])
+                
+                with col1:
+                    if element["type"] == "text":
+                        st.write(f"**Style:** {element.get('style', 'normal')}")
+                        content_preview = element.get('content', '')[:100]
+                        if len(element.get('content', '')) > 100:
+                            content_preview += "..."
+                        st.write(f"**Contenu:** {content_preview}")
+                    elif element["type"] == "image":
+                        st.write(f"**Source:** {element.get('image_type', 'inconnue')}")
+                        if element.get('caption'):
+                            st.write(f"**Légende:** {element['caption']}")
+                    elif element["type"] == "spacer":
+                        st.write(f"**Hauteur:** {element.get('height', 0)}px")
+                
+                with col2:
+                    st.button("⬆️ Monter", key=f"up_{i}", disabled=(i == 0),
+                              on_click=move_draft_element, args=(i, i - 1))
+                    st.button("⬇️ Descendre", key=f"down_{i}", disabled=(i == len(elements) - 1),
+                              on_click=move_draft_element, args=(i, i + 1))
+                
+                with col3:
+                    # Les images restent sur le disque : les versions précédentes peuvent les utiliser
+                    st.button("🗑️ Supprimer", key=f"delete_{i}", type="secondary",
+                              on_click=remove_draft_element, args=(i,))
+        
+        # Bouton pour tout effacer
+        st.markdown("---")
+        st.button("🗑️ Effacer tout le contenu personnalisé", type="secondary", on_click=clear_draft_elements)
+    
+    # Versions publiées, conservées pour revenir en arrière
+    with st.expander("🕓 Historique des versions"):
+        versions = list_content_versions()
+        selected = st.selectbox(
+            "Version",
+            versions,
+            format_func=lambda v: f"Version {v} - publiée le {load_content_version(v).get('published_at', '')[:16]}",
+            key="content_version_select"
+        )
+        if selected is not None and st.button("⏪ Revenir à cette version", disabled=(selected == current_content_version())):
+            rollback_content(selected)
+            discard_content_draft()
+            st.success(f"✅ Version {selected} republiée !")
+            st.rerun()
+
+def moderator_dashboard():
+    """Tableau de bord pour les modérateurs"""
+    st.title("Tableau de bord - Modérateurs")
+    
+    events = load_events()
+    event = select_event(events, key="dashboard_event")
+    
+    # Menu de navigation
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
+        "Inscriptions en attente", 
+        "Inscriptions confirmées", 
+        "Historique", 
+        "Export emails",
+        "Gestion image",
+        "Contenu personnalisé",
+        "Événements",
+        "Import"
+    ])
+    
+    if event is None:
+        for tab in (tab1, tab2, tab3, tab8):
+            with tab:
+                st.info("Aucun événement. Créez-en un dans l'onglet « Événements ».")
+    else:
+        with tab1:
+            pending_tab(event)
+            # Après la liste : lors d'un rendu complet, la version affichée est déjà à jour
+            watch_pending(event)
+        
+        with tab2:
+            confirmed_tab(event)
+        
+        with tab3:
+            history_tab(events, event)
+        
+        with tab8:
+            import_tab(event)
+    
+    with tab4:
+        export_tab(events)
+    
+    with tab7:
+        events_tab(events)
+    
+    with tab5:
+        st.header("Gestion de l'image d'accueil")
+        
+        image_config = load_image_config()
+        
+        st.subheader("Configuration de l'image")
+        
+        # Choix du type d'image (en dehors du formulaire pour plus de réactivité)
+        image_type = st.radio(
+            "Type d'image",
+            ["none", "local", "url"],
+            format_func=lambda x: {
+                "none": "Aucune image",
+                "local": "📁 Image depuis mon PC",
+                "url": "🌐 Image depuis une URL"
+            }[x],
+            index=["none", "local", "url"].index(image_config.get("image_type", "none"))
+        )
+        
+        # Formulaire avec les champs appropriés selon le type sélectionné
+        with st.form("image_form"):
+            image_url = ""
+            uploaded_file = None
+            
+            if image_type == "url":
+                st.info("💡 Entrez l'URL complète d'une image hébergée sur internet")
+                # URL de l'image
+                image_url = st.text_input(
+                    "URL de l'image",
+                    value=image_config.get("image_url", "") if image_config.get("image_type") == "url" else "",
+                    placeholder="https://exemple.com/image.jpg"
+                )
+            elif image_type == "local":
+                st.info("📤 Sélectionnez une image depuis votre ordinateur")
+                # Upload d'image locale
+                uploaded_file = st.file_uploader(
+                    "Choisir une image depuis votre PC",
+                    type=['png', 'jpg', 'jpeg', 'gif', 'bmp'],
+                    help="Formats supportés : PNG, JPG, JPEG, GIF, BMP. L'image sera automatiquement redimensionnée si nécessaire.",
+                    key="image_uploader"
+                )
+                
+                # Afficher un aperçu de l'image uploadée
+                if uploaded_file is not None:
+                    st.success(f"✅ Image sélectionnée : {uploaded_file.name}")
+                    try:
+                        # Prévisualisation : la miniature est réutilisée pour la sauvegarde
+                        with st.spinner("Traitement de l'image..."):
+                            ingested = ingest_uploaded_image(uploaded_file)
+                        st.image(ingested['data'], caption="Aperçu de l'image à uploader", width=300)
+                        st.caption(memory_report(ingested))
+                    except ValueError as e:
+                        st.error(f"Erreur lors de la prévisualisation de l'image : {e}")
+            elif image_type == "none":
+                st.info("❌ Aucune image ne sera affichée sur la page d'accueil")
+            
+            # Légende de l'image (seulement si ce n'est pas "none")
+            image_caption = ""
+            if image_type != "none":
+                image_caption = st.text_input(
+                    "Légende de l'image (optionnel)",
+                    value=image_config.get("image_caption", ""),
+                    placeholder="Description de l'image"
+                )
+            
+            submitted = st.form_submit_button("💾 Sauvegarder la configuration", type="primary", use_container_width=True)
+            
+            if submitted:
+                new_config = {
+                    "image_type": image_type,
+                    "image_url": "",
+                    "image_path": "",
+                    "image_caption": image_caption.strip()
+                }
+                
+                if image_type == "url" and image_url.strip():
+                    new_config["image_url"] = image_url.strip()
+                    st.success("✅ Configuration URL sauvegardée !")
+                elif image_type == "local":
+                    if uploaded_file is not None:
+                        # Sauvegarder l'image uploadée
+                        saved_path = save_uploaded_image(uploaded_file)
+                        if saved_path:
+                            new_config["image_path"] = saved_path
+                            # Supprimer l'ancienne image si elle existe
+                            old_config = load_image_config()
+                            if (old_config.get("image_type") == "local" and 
+                                old_config.get("image_path") and 
+                                os.path.exists(old_config["image_path"]) and
+                                old_config["image_path"] != saved_path):
+                                try:
+                                    os.remove(old_config["image_path"])
+                                except:
+                                    pass
+                            st.success("✅ Image uploadée et sauvegardée !")
+                        else:
+                            st.error("❌ Erreur lors de la sauvegarde de l'image")
+                            st.stop()
+                    elif image_config.get("image_type") == "local" and image_config.get("image_path"):
+                        # Garder l'image existante si aucune nouvelle image n'est uploadée
+                        new_config["image_path"] = image_config.get("image_path", "")
+                        st.success("✅ Configuration sauvegardée (image existante conservée)")
+                    else:
+                        st.warning("⚠️ Aucune image sélectionnée. Sélectionnez une image ou choisissez un autre type.")
+                        st.stop()
+                elif image_type == "none":
+                    st.success("✅ Configuration sauvegardée (aucune image)")
+                
+                save_image_config(new_config)
+                st.rerun()
+        
+        # Prévisualisation
+        st.subheader("Prévisualisation actuelle")
+        if not display_image_from_config():
+            pass  # Message déjà affiché dans display_image_from_config()
+        
+        # Gestion des images uploadées
+        st.subheader("Gestion des fichiers")
+        if os.path.exists(IMAGES_FOLDER):
+            image_files = [f for f in os.listdir(IMAGES_FOLDER) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))]
+            if image_files:
+                st.write(f"**{len(image_files)} image(s) stockée(s) localement**")
+                
+                # Calculer la taille totale
+                total_size = 0
+                for file in image_files:
+                    filepath = os.path.join(IMAGES_FOLDER, file)
+                    if os.path.exists(filepath):
+                        total_size += os.path.getsize(filepath)
+                
+                size_mb = total_size / (1024 * 1024)
+                st.write(f"Espace utilisé : {size_mb:.2f} MB")
+                
+                # Option pour nettoyer les anciennes images
+                if st.button("Nettoyer les images non utilisées", help="Supprime les images qui ne sont ni l'image d'accueil, ni utilisées par une version du contenu ou par le brouillon"):
+                    # Images encore utilisées : accueil, versions conservées du contenu, brouillon
+                    used_images = referenced_images() | {image_config.get("image_path", "")}
+                    used_images |= {e.get("image_path") for e in content_draft()['elements']}
+                    deleted_count = 0
+                    
+                    for file in image_files:
+                        filepath = os.path.join(IMAGES_FOLDER, file)
+                        if filepath not in used_images:
+                            try:
+                                os.remove(filepath)
+                                deleted_count += 1
+                            except:
+                                pass
+                    
+                    if deleted_count > 0:
+                        st.success(f"{deleted_count} image(s) supprimée(s)")
+                        st.rerun()
+                    else:
+                        st.info("Aucune image à supprimer")
+            else:
+                st.info("Aucune image stockée localement")
+    
+    with tab6:
+        content_tab()
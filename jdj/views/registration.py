@@ -0,0 +1,93 @@
+"""Page d'inscription pour les participants"""
+
+from datetime import datetime, date
+
+import streamlit as st
+
+from jdj.display import select_event
+from jdj.events import upcoming_events, register, spots_left
+from jdj.utils import validate_email, generate_captcha
+
+
+def registration_page():
+    """Page d'inscription pour les participants"""
+    st.title("Inscription JdJ")
+    st.markdown("---")
+    
+    event = select_event(upcoming_events(), "Choisir l'événement", key="registration_event")
+    if event is None:
+        st.info("Aucun événement n'est ouvert aux inscriptions pour le moment.")
+        return
+    
+    remaining = spots_left(event)
+    if remaining == 0:
+        st.warning("L'événement est complet : les nouvelles inscriptions sont placées sur liste d'attente.")
+    elif remaining is not None:
+        st.info(f"Places restantes : {remaining}")
+    
+    with st.form("inscription_form"):
+        st.header("Informations personnelles")
+        
+        # Champs du formulaire
+        email = st.text_input("Adresse email *", placeholder="votre.email@exemple.com")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            nom = st.text_input("Nom *", placeholder="Dupont")
+        with col2:
+            prenom = st.text_input("Prénom *", placeholder="Jean")
+        
+        date_naissance = st.date_input(
+            "Date de naissance *",
+            min_value=date(1900, 1, 1),
+            max_value=date.today()
+        )
+        
+        # Captcha
+        st.subheader("Vérification anti-robot")
+        st.write(f"Résolvez cette opération : **{st.session_state.captcha_question}**")
+        captcha_response = st.number_input("Votre réponse", min_value=-100, max_value=100, value=0)
+        
+        submitted = st.form_submit_button("S'inscrire", type="primary", use_container_width=True)
+        
+        if submitted:
+            # Validation des champs
+            errors = []
+            
+            if not email or not validate_email(email):
+                errors.append("Adresse email invalide")
+            if not nom.strip():
+                errors.append("Le nom est obligatoire")
+            if not prenom.strip():
+                errors.append("Le prénom est obligatoire")
+            if captcha_response != st.session_state.captcha_answer:
+                errors.append("Réponse incorrecte au captcha")
+            
+            if errors:
+                for error in errors:
+                    st.error(error)
+                # Générer un nouveau captcha
+                st.session_state.captcha_question, st.session_state.captcha_answer = generate_captcha()
+                st.rerun()
+            else:
+                # Sauvegarder l'inscription (sur liste d'attente si l'événement est complet)
+                status = register(event, {
+                    'email': email,
+                    'nom': nom.strip(),
+                    'prenom': prenom.strip(),
+                    'date_naissance': str(date_naissance),
+                    'date_inscription': str(datetime.now()),
+                    'confirmed': False
+                })
+                
+                if status == 'doublon':
+                    st.error("Cette adresse email est déjà enregistrée")
+                else:
+                    if status == 'attente':
+                        st.warning("L'événement est complet : vous êtes inscrit(e) sur la liste d'attente. "
+                                   "Vous serez repris(e) automatiquement si une place se libère.")
+                    else:
+                        st.success("Inscription réussie ! Votre demande sera examinée par les modérateurs.")
+                    
+                    # Générer un nouveau captcha pour la prochaine inscription
+                    st.session_state.captcha_question, st.session_state.captcha_answer = generate_captcha()
@@ -0,0 +1,106 @@
+"""Vérifie la validation des fichiers d'import sur des cas limites.
+
+Chaque cas est un petit fichier CSV construit en mémoire ; le script
+vérifie que seules les lignes fautives sont rejetées, avec le bon motif, au
+lieu d'un rejet du fichier entier :
+
+- une date de naissance hors de la plage des nanosecondes (31/12/2999) ;
+- un CSV « ANSI » enregistré par Excel sous Windows (Windows-1252).
+
+Les fichiers illisibles (XLSX tronqué, CSV sans séparateur détectable)
+doivent lever ``ValueError``, affichée comme « Fichier illisible » par le
+tableau de bord, et non une autre exception.
+
+Usage :
+    python tools/check_bulk_import.py
+"""
+
+import io
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from jdj.bulk_import import prepare_import  # noqa: E402
+
+HEADER = "Email;Nom;Prénom;Date de naissance\n"
+ROWS = [
+    "anna@exemple.ch;Muster;Anna;2008-03-04",
+    "ben@exemple.ch;Keller;Ben;04.05.2009",
+    "chloe@exemple.ch;Favre;Chloé;12/06/2007",
+    "david@exemple.ch;Rochat;David;2010-01-15",
+    "emma@exemple.ch;Meier;Emma;2009-11-30",
+    "futur@exemple.ch;Dubois;Félix;31/12/2999",
+    "gina@exemple.ch;Roth;Gina;2008-08-08",
+]
+
+
+def uploaded_file(data, name):
+    """Fichier uploadé simulé"""
+    uploaded = io.BytesIO(data)
+    uploaded.name = name
+    return uploaded
+
+
+def csv_file(text, encoding="utf-8"):
+    return uploaded_file(text.encode(encoding), "import.csv")
+
+
+def check_unreadable(label, uploaded):
+    """Retourne les erreurs d'un fichier qui doit être refusé par ValueError"""
+    try:
+        prepare_import(uploaded, [])
+    except ValueError:
+        return []
+    except Exception as e:
+        return [f"{label} : {type(e).__name__} au lieu de ValueError ({e})"]
+    return [f"{label} : fichier accepté"]
+
+
+def check_case(label, uploaded, expected_rejected):
+    """Retourne les erreurs d'un cas : lignes rejetées attendues {ligne: motif}"""
+    try:
+        accepted, rejected = prepare_import(uploaded, [])
+    except ValueError as e:
+        return [f"{label} : fichier entier rejeté ({e})"]
+    errors = []
+    found = dict(zip(rejected.index, rejected['motif']))
+    if found != expected_rejected:
+        errors.append(f"{label} : lignes rejetées {found}, attendu {expected_rejected}")
+    if len(accepted) != len(ROWS) - len(expected_rejected):
+        errors.append(f"{label} : {len(accepted)} lignes acceptées sur {len(ROWS)}")
+    return errors
+
+
+def main():
+    text = HEADER + "\n".join(ROWS) + "\n"
+    errors = []
+    errors += check_case("date hors plage", csv_file(text), {7: "Date de naissance hors limites"})
+    errors += check_case("CSV Windows-1252", csv_file(text, "cp1252"), {7: "Date de naissance hors limites"})
+
+    accepted, _ = prepare_import(csv_file(text, "cp1252"), [])
+    if "Chloé" not in accepted['prenom'].tolist():
+        errors.append("CSV Windows-1252 : accents mal décodés")
+
+    # Moitié d'un vrai fichier XLSX (archive zip tronquée)
+    workbook = io.BytesIO()
+    pd.DataFrame([row.split(";") for row in ROWS], columns=HEADER.strip().split(";")).to_excel(
+        workbook, index=False
+    )
+    truncated = workbook.getvalue()[:len(workbook.getvalue()) // 2]
+    errors += check_unreadable("XLSX tronqué", uploaded_file(truncated, "import.xlsx"))
+    errors += check_unreadable("CSV vide", csv_file(""))
+
+    if errors:
+        for error in errors:
+            print(f"ÉCHEC : {error}")
+        return 1
+    print("OK : validation de l'import")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
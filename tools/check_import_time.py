@@ -0,0 +1,87 @@
+"""Vérifie le budget de démarrage à froid des pages publiques.
+
+Importe, dans un interpréteur neuf, les modules nécessaires à la page
+d'accueil et au formulaire d'inscription (streamlit étant déjà chargé), puis
+échoue si le temps d'import dépasse le budget ou si un module lourd
+(pandas, PIL) est chargé sur ce chemin.
+
+Usage :
+    python tools/check_import_time.py [--budget-ms 50] [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules chargés pour un visiteur qui ne se connecte pas en modérateur
+PUBLIC_MODULES = [
+    "jdj.config",
+    "jdj.storage",
+    "jdj.events",
+    "jdj.content",
+    "jdj.utils",
+    "jdj.display",
+    "jdj.views.home",
+    "jdj.views.registration",
+    "jdj.views.login",
+]
+
+# Modules qui ne doivent être importés que côté modérateurs
+FORBIDDEN_MODULES = ["pandas", "PIL"]
+
+PROBE = """
+import json, sys, time
+import streamlit
+before = set(sys.modules)
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+new = sorted(set(sys.modules) - before)
+print(json.dumps({{"elapsed_ms": elapsed * 1000, "new_modules": new}}))
+"""
+
+
+def measure_once():
+    """Mesure l'import des pages publiques dans un nouvel interpréteur"""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(modules=PUBLIC_MODULES)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="temps d'import maximal en millisecondes")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="nombre de mesures (le minimum est retenu)")
+    args = parser.parse_args(argv)
+
+    measures = [measure_once() for _ in range(args.runs)]
+    best = min(m["elapsed_ms"] for m in measures)
+    loaded = measures[0]["new_modules"]
+    heavy = sorted({
+        name for name in loaded
+        for forbidden in FORBIDDEN_MODULES
+        if name == forbidden or name.startswith(forbidden + ".")
+    })
+
+    print(f"Import des pages publiques : {best:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    failed = False
+    if best > args.budget_ms:
+        print("ÉCHEC : budget de démarrage dépassé")
+        failed = True
+    if heavy:
+        print("ÉCHEC : modules lourds importés sur le chemin public : " + ", ".join(heavy))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
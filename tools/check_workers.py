@@ -0,0 +1,195 @@
+"""Vérifie le fonctionnement à plusieurs processus sur un même dossier de données.
+
+Démarre plusieurs workers Streamlit sur un dossier temporaire et attend
+qu'ils répondent. Les écritures et lectures passent ensuite par
+l'application elle-même (``AppTest``, un runtime Streamlit complet avec son
+propre ``st.cache_data``), exécutée dans des processus séparés comme le
+seraient les workers. Le script vérifie que :
+
+- les inscriptions faites en parallèle par le formulaire ne sont pas
+  perdues et leurs identifiants restent uniques ;
+- la capacité n'est jamais dépassée et le compteur correspond aux données ;
+- un tableau de bord déjà ouvert dans un processus voit, à sa relance
+  suivante, l'inscription faite depuis un autre processus (invalidation du
+  cache).
+
+Usage :
+    python tools/check_workers.py [--workers 3] [--signups 10] [--no-servers]
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+from run_workers import APP, start_workers, stop_workers  # noqa: E402
+
+EVENT_ID = "check-workers"
+CAPACITY = 25
+
+
+def free_port_range(count):
+    """Premier port d'une plage de ``count`` ports libres"""
+    for base in range(18501, 19500, count):
+        try:
+            for port in range(base, base + count):
+                with socket.socket() as s:
+                    s.bind(("127.0.0.1", port))
+            return base
+        except OSError:
+            continue
+    raise RuntimeError("Aucune plage de ports libre")
+
+
+def wait_healthy(base_port, count, timeout=60):
+    """Attend que chaque worker réponde sur son point de santé"""
+    deadline = time.time() + timeout
+    pending = set(range(base_port, base_port + count))
+    while pending and time.time() < deadline:
+        for port in list(pending):
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=2) as r:
+                    if r.status == 200:
+                        pending.discard(port)
+            except OSError:
+                pass
+        time.sleep(0.5)
+    return not pending
+
+
+def _status(at):
+    """Résultat affiché après l'envoi du formulaire d'inscription"""
+    if any("Inscription réussie" in e.value for e in at.success):
+        return 'inscrit'
+    if any("vous êtes inscrit(e) sur la liste d'attente" in e.value for e in at.warning):
+        return 'attente'
+    return 'erreur'
+
+
+def sign_up(args):
+    """Inscrit une série de personnes par le formulaire, depuis un processus séparé"""
+    from streamlit.testing.v1 import AppTest
+    worker, count = args
+    at = AppTest.from_file(APP, default_timeout=30)
+    at.session_state['page'] = 'inscription'
+    at.run()
+    results = []
+    for i in range(count):
+        email, nom, prenom = at.text_input
+        email.input(f"w{worker}-{i}@exemple.ch")
+        nom.input(f"Worker{worker}")
+        prenom.input(str(i))
+        at.number_input[0].set_value(at.session_state['captcha_answer'])
+        submit = next(button for button in at.button if button.form_id == "inscription_form")
+        submit.click().run()
+        results.append(_status(at))
+    return results
+
+
+def _listed_registrations(at):
+    """Nombre d'inscriptions (en attente et liste d'attente) listées dans le tableau de bord"""
+    return len([button for button in at.button if (button.key or "").startswith("delete_reg_")])
+
+
+def watch(ready, go, results):
+    """Session modérateur ouverte avant une écriture d'un autre processus"""
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(APP, default_timeout=30)
+    at.session_state['logged_in'] = True
+    at.session_state['page'] = 'moderator'
+    at.run()
+    before = _listed_registrations(at)
+    ready.set()
+    go.wait()
+    at.run()
+    results.put((before, _listed_registrations(at)))
+
+
+def check(workers, signups):
+    from jdj.events import load_counter, load_registrations, new_event, save_event
+
+    errors = []
+    save_event(new_event(EVENT_ID, "Vérification multi-processus", "2030-01-01", CAPACITY))
+
+    # spawn : chaque processus démarre son propre runtime Streamlit
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers) as pool:
+        results = [s for batch in pool.map(sign_up, [(w, signups) for w in range(workers)]) for s in batch]
+
+    total = workers * signups
+    registrations = load_registrations(EVENT_ID)
+    counter = load_counter(EVENT_ID)
+    occupied = len([reg for reg in registrations if not reg['waitlisted']])
+
+    if results.count('erreur'):
+        errors.append(f"{results.count('erreur')} envois du formulaire sans confirmation")
+    if len(registrations) != total:
+        errors.append(f"{len(registrations)} inscriptions enregistrées sur {total}")
+    if len({reg['id'] for reg in registrations}) != len(registrations):
+        errors.append("identifiants d'inscription en double")
+    if occupied != min(total, CAPACITY) or results.count('inscrit') != occupied:
+        errors.append(f"{occupied} places occupées pour une capacité de {CAPACITY}")
+    if (counter['occupied'], counter['waitlisted']) != (occupied, len(registrations) - occupied):
+        errors.append(f"compteur incohérent : {counter}")
+
+    # Une session ouverte dans un processus doit voir l'écriture d'un autre
+    ready, go, seen = context.Event(), context.Event(), context.Queue()
+    watcher = context.Process(target=watch, args=(ready, go, seen))
+    watcher.start()
+    ready.wait(60)
+    with context.Pool(1) as pool:
+        pool.map(sign_up, [(workers, 1)])
+    go.set()
+    before, after = seen.get(timeout=60)
+    watcher.join()
+    if after != before + 1:
+        errors.append(f"le tableau de bord liste {after} inscriptions au lieu de {before} + 1 "
+                      "après l'écriture d'un autre processus")
+
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=3, help="nombre de processus")
+    parser.add_argument("--signups", type=int, default=10, help="inscriptions par processus")
+    parser.add_argument("--no-servers", action="store_true",
+                        help="ne pas démarrer de serveurs Streamlit (AppTest seul)")
+    args = parser.parse_args(argv)
+
+    data_dir = tempfile.mkdtemp(prefix="jdj-workers-")
+    servers = []
+    try:
+        errors = []
+        if not args.no_servers:
+            base_port = free_port_range(args.workers)
+            servers = start_workers(args.workers, base_port, data_dir)
+            if not wait_healthy(base_port, args.workers):
+                errors.append("tous les workers Streamlit n'ont pas démarré")
+
+        os.chdir(data_dir)
+        errors += check(args.workers, args.signups)
+    finally:
+        stop_workers(servers)
+        os.chdir(ROOT)
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    if errors:
+        for error in errors:
+            print(f"ÉCHEC : {error}")
+        return 1
+    print(f"OK : {args.workers} processus sur le même dossier de données")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Lance plusieurs processus Streamlit sur le même dossier de données.
+
+Chaque processus écoute sur son propre port ; un reverse proxy local
+répartit les visiteurs entre eux. Streamlit garde la session d'un visiteur
+dans le processus qui l'a ouverte (websocket) : le proxy doit donc être
+configuré avec des sessions persistantes (``ip_hash`` pour nginx).
+
+Usage :
+    python tools/run_workers.py --workers 4 --base-port 8501 --data-dir .
+"""
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "streamlit_app.py")
+
+NGINX_TEMPLATE = """upstream jdj {{
+    ip_hash;
+{servers}
+}}
+
+server {{
+    listen 8080;
+    location / {{
+        proxy_pass http://jdj;
+        proxy_http_version 1.1;
+        proxy_set_header Upgrade $http_upgrade;
+        proxy_set_header Connection "upgrade";
+        proxy_set_header Host $host;
+        proxy_read_timeout 86400;
+    }}
+}}"""
+
+
+def start_workers(count, base_port, data_dir):
+    """Démarre ``count`` processus Streamlit et retourne les ``Popen``
+
+    Les chemins de données étant relatifs, chaque processus est lancé avec
+    ``data_dir`` comme dossier courant : tous partagent les mêmes fichiers.
+    """
+    workers = []
+    for i in range(count):
+        port = base_port + i
+        workers.append(subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", APP,
+                "--server.port", str(port),
+                "--server.headless", "true",
+                # Le proxy gère l'origine ; les workers ne surveillent pas le code
+                "--server.fileWatcherType", "none",
+                "--browser.gatherUsageStats", "false",
+            ],
+            cwd=data_dir,
+        ))
+    return workers
+
+
+def stop_workers(workers):
+    """Arrête proprement les processus lancés par ``start_workers``"""
+    for worker in workers:
+        if worker.poll() is None:
+            worker.terminate()
+    for worker in workers:
+        try:
+            worker.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            worker.kill()
+
+
+def nginx_config(count, base_port):
+    """Exemple de configuration nginx pour répartir entre les workers"""
+    servers = "\n".join(f"    server 127.0.0.1:{base_port + i};" for i in range(count))
+    return NGINX_TEMPLATE.format(servers=servers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=2, help="nombre de processus")
+    parser.add_argument("--base-port", type=int, default=8501, help="port du premier processus")
+    parser.add_argument("--data-dir", default=ROOT, help="dossier des données partagées")
+    args = parser.parse_args(argv)
+
+    workers = start_workers(args.workers, args.base_port, os.path.abspath(args.data_dir))
+    print(f"{args.workers} worker(s) démarré(s) sur {args.data_dir}")
+    print("Exemple de configuration nginx :\n")
+    print(nginx_config(args.workers, args.base_port))
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        while all(worker.poll() is None for worker in workers):
+            time.sleep(1)
+        print("Un worker s'est arrêté, arrêt des autres")
+        return 1
+    except (KeyboardInterrupt, SystemExit):
+        return 0
+    finally:
+        stop_workers(workers)
+
+
+if __name__ == "__main__":
+    sys.exit(main())